@@ -1,7 +1,16 @@
+from src.profiler.startup import startup_timer
+import argparse
 from src.game import Game
 
-def main(): 
-    game = Game()
+startup_timer.mark('imports')
+
+def main(argv=None): 
+    parser = argparse.ArgumentParser(description='Labirintity')
+    parser.add_argument('--startup-report', nargs='?', const='text', choices=['text', 'json'],
+                        help='mostra o tempo de inicialização até o primeiro quadro do menu e sai')
+    parser.add_argument('--record', metavar='PATH', help='grava as teclas da partida para python -m src.replay.playback')
+    args = parser.parse_args(argv)
+    game = Game(args.startup_report, args.record)
     game.run()
 
 if __name__ == "__main__":
@@ -0,0 +1,443 @@
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import json
+import math
+import subprocess
+import sys
+import time
+from collections import deque
+import numpy as np
+from src import config
+from src.game import Game
+from src.maps.maze_generator import generate_maze
+from src.maps.skip_field import SkipField
+from src.replay.playback import replay_session, format_replay
+from src.renderer.backends import BACKENDS
+
+QUALITIES = ['low', 'medium', 'high']
+RESOLUTIONS = [(1280, 720), (1600, 900), (1920, 1080)]
+
+def find_path(grid, start):
+    # BFS pelas células livres até a vizinha da saída (9); sem saída, percorre tudo o que alcança
+    height, width = len(grid), len(grid[0])
+    previous = {start: None}
+    queue = deque([start])
+    goal = start
+    while queue:
+        cell = queue.popleft()
+        goal = cell
+        x, y = cell
+        if any(0 <= y + dy < height and 0 <= x + dx < width and grid[y + dy][x + dx] == 9 for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))):
+            break
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            nx, ny = x + dx, y + dy
+            if 0 <= ny < height and 0 <= nx < width and grid[ny][nx] == 0 and (nx, ny) not in previous:
+                previous[(nx, ny)] = cell
+                queue.append((nx, ny))
+    path = []
+    while goal is not None:
+        path.append(goal); goal = previous[goal]
+    return path[::-1]
+
+def make_camera_path(grid, frames, start):
+    cells = find_path(grid, (int(start[0]), int(start[1])))
+    points = [(x + 0.5, y + 0.5) for x, y in cells]
+    if len(points) == 1:
+        return [(points[0][0], points[0][1], 2 * math.pi * i / frames) for i in range(frames)]
+
+    poses = []
+    segments = len(points) - 1
+    for i in range(frames):
+        t = i * segments / max(frames - 1, 1)
+        index = min(int(t), segments - 1)
+        f = t - index
+        (x0, y0), (x1, y1) = points[index], points[index + 1]
+        heading = math.atan2(y1 - y0, x1 - x0)
+        sway = 0.6 * math.sin(i * 0.15)
+        poses.append((x0 + (x1 - x0) * f, y0 + (y1 - y0) * f, (heading + sway) % (2 * math.pi)))
+    return poses
+
+class RenderBenchmark:
+    def __init__(self, frames=120, warmup=5, levels=None, qualities=None, resolutions=None):
+        self.frames = frames
+        self.warmup = warmup
+        self.game = Game()
+        self.levels = levels if levels is not None else self.game.maps.get_levels()
+        self.qualities = qualities or QUALITIES
+        self.resolutions = resolutions or RESOLUTIONS
+
+    def run_case(self, level, quality, resolution, workers=None):
+        game = self.game
+        game.change_resolution(*resolution)
+        game.set_graphics_quality(quality)
+        if workers is not None: config.RENDER_WORKERS = workers
+        game.current_level = level
+        game.reset_level()
+        player = game.player
+        poses = make_camera_path(player.map, self.frames, (player.x, player.y))
+
+        frame_times = self.measure_poses(poses)
+        frame_ms = np.array(frame_times) * 1000
+        rays = len(game.renderer.ray_angles) * len(frame_times)
+        return {
+            'level': level, 'quality': quality, 'resolution': f"{resolution[0]}x{resolution[1]}",
+            'frames': len(frame_times),
+            'p50_ms': float(np.percentile(frame_ms, 50)),
+            'p95_ms': float(np.percentile(frame_ms, 95)),
+            'p99_ms': float(np.percentile(frame_ms, 99)),
+            'rays_per_sec': rays / max(sum(frame_times), 1e-9),
+            'workers': game.renderer.strip_pool.get_worker_count(),
+        }
+
+    def measure_poses(self, poses):
+        game, player = self.game, self.game.player
+        for x, y, rot in poses[:self.warmup]:
+            player.x, player.y, player.rot = x, y, rot
+            game.renderer.render_game_world()
+        # As poses do aquecimento se repetem na medição; sem limpar, viriam do cache de raios
+        game.renderer.view_cache.clear()
+
+        frame_times = []
+        for x, y, rot in poses:
+            player.x, player.y, player.rot = x, y, rot
+            start = time.perf_counter()
+            game.renderer.render_game_world()
+            frame_times.append(time.perf_counter() - start)
+        return frame_times
+
+    def run_maze_scaling(self, sizes, seed=1, report=print):
+        # Custo de gerar, renderizar e colidir em labirintos gerados cada vez maiores
+        game = self.game
+        resolution, quality = self.resolutions[0], self.qualities[0]
+        game.change_resolution(*resolution)
+        game.set_graphics_quality(quality)
+        level = max(game.maps.get_levels()) + 1
+        rng = np.random.default_rng(seed)
+        results = []
+        for size in sizes:
+            start = time.perf_counter()
+            game.maps.add_generated_level(level, size, size, seed)
+            grid = game.maps.get_map(level)
+            generate_ms = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            game.maps.get_exit_field(level)
+            exit_field_ms = (time.perf_counter() - start) * 1000
+            game.current_level = level
+            game.reset_level()
+            player = game.player
+
+            free = np.flatnonzero(grid.ravel() == 0)
+            cells = rng.choice(free, self.frames)
+            poses = [(c % size + 0.5, c // size + 0.5, r) for c, r in zip(cells.tolist(), rng.uniform(0, 2 * math.pi, self.frames).tolist())]
+            frame_ms = np.array(self.measure_poses(poses)) * 1000
+
+            start = time.perf_counter()
+            for x, y, rot in poses:
+                player.x, player.y, player.rot = x, y, rot
+                player.can_move_to(x + 0.05, y)
+                player.check_interaction()
+            collision_us = (time.perf_counter() - start) / len(poses) * 1e6
+
+            result = {'size': f"{size}x{size}", 'grid_bytes': int(grid.nbytes), 'generate_ms': generate_ms, 'exit_field_ms': exit_field_ms,
+                      'p50_ms': float(np.percentile(frame_ms, 50)), 'p95_ms': float(np.percentile(frame_ms, 95)),
+                      'collision_us': collision_us}
+            results.append(result)
+            report(f"{result['size']:<10} grade {result['grid_bytes'] / 1e6:6.2f} MB  gerar {generate_ms:7.1f} ms  dica {exit_field_ms:6.1f} ms  "
+                   f"render p50 {result['p50_ms']:6.2f} ms  p95 {result['p95_ms']:6.2f} ms  colisão {collision_us:6.1f} us")
+        return results
+
+    def run_ray_skip(self, sizes, seed=1, repeats=7, report=print):
+        # Só o lançamento de raios (BatchRaycaster.cast), DDA passo a passo contra o salto pelo campo por eixo
+        game = self.game
+        game.change_resolution(*self.resolutions[0])
+        game.set_graphics_quality(self.qualities[0])
+        ray_angles, raycaster = game.renderer.ray_angles, game.renderer.raycaster
+        cases = []
+        for level in self.levels:
+            game.current_level = level
+            game.reset_level()
+            cases.append((f"nível {level}", game.player.map, (game.player.x, game.player.y)))
+        for size in sizes:
+            grid = generate_maze(size, size, seed)
+            cases.append((f"{size}x{size}", grid, (1.5, 1.5)))
+
+        results = []
+        for name, grid, start in cases:
+            skip_field = SkipField(grid)
+            poses = make_camera_path(grid, self.frames, start)
+            modes = (('dda', None), ('skip', skip_field))
+            exact = [raycaster.cast(x, y, rot, ray_angles, grid) for x, y, rot in poses]
+            rays = [raycaster.cast(x, y, rot, ray_angles, grid, skip_field) for x, y, rot in poses]
+            identical = all(np.array_equal(a, b) for ra, rb in zip(exact, rays) for a, b in zip(ra, rb))
+            for mode, field in modes:
+                for x, y, rot in poses[:self.warmup]: raycaster.cast(x, y, rot, ray_angles, grid, field)
+            # Os dois modos alternados pose a pose (ruído da máquina cai nos dois) e mediana das rodadas (ignora picos)
+            rounds = {mode: [] for mode, _ in modes}
+            for _ in range(repeats):
+                totals = dict.fromkeys(rounds, 0.0)
+                for x, y, rot in poses:
+                    for mode, field in modes:
+                        start_time = time.perf_counter()
+                        raycaster.cast(x, y, rot, ray_angles, grid, field)
+                        totals[mode] += time.perf_counter() - start_time
+                for mode, total in totals.items(): rounds[mode].append(total / len(poses) * 1000)
+            speedups = np.array(rounds['dda']) / np.maximum(rounds['skip'], 1e-9)
+            result = {'case': name, 'dda_ms': float(np.median(rounds['dda'])), 'skip_ms': float(np.median(rounds['skip'])),
+                      'speedup_min': float(speedups.min()), 'speedup_max': float(speedups.max()),
+                      'repeats': repeats, 'identical': identical}
+            result['speedup'] = result['dda_ms'] / max(result['skip_ms'], 1e-9)
+            results.append(result)
+            report(f"{name:<12} dda {result['dda_ms']:6.3f} ms  salto {result['skip_ms']:6.3f} ms  "
+                   f"speedup {result['speedup']:.2f}x ({result['speedup_min']:.2f}-{result['speedup_max']:.2f}x em {repeats} rodadas)  "
+                   f"{'idênticos' if identical else 'DIFERENTES'}")
+        return results
+
+    def run_sprite_load(self, counts, seed=1, report=print):
+        # Quadro inteiro com N sprites espalhados pelas células vazias do nível, contra o mesmo caminho sem sprites
+        game = self.game
+        game.change_resolution(*self.resolutions[0])
+        game.set_graphics_quality(self.qualities[0])
+        rng = np.random.default_rng(seed)
+        results = []
+        for level in self.levels:
+            game.current_level = level
+            game.reset_level()
+            player, sprites = game.player, game.renderer.sprites
+            poses = make_camera_path(player.map, self.frames, (player.x, player.y))
+            free = np.flatnonzero(player.map.ravel() == 0)
+            width = player.map.shape[1]
+            for count in counts:
+                sprites.clear()
+                cells = rng.choice(free, count)
+                sprites.add_many(cells % width + rng.uniform(0.2, 0.8, count), cells // width + rng.uniform(0.2, 0.8, count),
+                                 rng.integers(0, 3, count).astype(np.int32), rng.uniform(0.4, 1.0, count))
+                frame_ms = np.array(self.measure_poses(poses)) * 1000
+                result = {'level': level, 'sprites': count, 'p50_ms': float(np.percentile(frame_ms, 50)),
+                          'p95_ms': float(np.percentile(frame_ms, 95)),
+                          'drawn_last_frame': game.renderer.sprite_renderer.last_drawn}
+                results.append(result)
+                report(f"nível {level}  sprites {count:5d}  p50 {result['p50_ms']:6.2f} ms  p95 {result['p95_ms']:6.2f} ms")
+        return results
+
+    def run(self, report=print):
+        results = []
+        for resolution in self.resolutions:
+            for quality in self.qualities:
+                for level in self.levels:
+                    result = self.run_case(level, quality, resolution)
+                    results.append(result)
+                    report(format_result(result))
+        return results
+
+    def run_scaling(self, worker_counts, report=print):
+        # Speedup do passe em faixas em relação a um worker, no preset 'high'
+        results = []
+        for resolution in self.resolutions:
+            for level in self.levels:
+                single = None
+                for workers in worker_counts:
+                    result = self.run_case(level, 'high', resolution, workers)
+                    single = single or result['p50_ms']
+                    result['speedup'] = single / max(result['p50_ms'], 1e-9)
+                    results.append(result)
+                    report(f"{format_result(result)}  workers {workers:2d}  speedup {result['speedup']:.2f}x")
+        return results
+
+    def run_render_scale(self, scales, report=print):
+        # Quadro inteiro (mundo + ampliação) por escala do passe do mundo, na mesma resolução de saída
+        results = []
+        for resolution in self.resolutions:
+            for quality in self.qualities:
+                for level in self.levels:
+                    full = None
+                    for scale in scales:
+                        config.RENDER_SCALE = scale
+                        result = self.run_case(level, quality, resolution)
+                        result['render_scale'] = scale
+                        result['world_size'] = '{}x{}'.format(*self.game.renderer.get_world_size())
+                        full = full or result['p50_ms']
+                        result['speedup'] = full / max(result['p50_ms'], 1e-9)
+                        results.append(result)
+                        report(f"{format_result(result)}  escala {scale:.2f} ({result['world_size']})  speedup {result['speedup']:.2f}x")
+        config.RENDER_SCALE = 1.0
+        return results
+
+    def run_backends(self, names, report=print):
+        # Mesmo caminho de câmera em cada backend do passe de paredes; classifica pelo p50 somado dos casos
+        results, totals = [], {}
+        requested = config.RAYCAST_BACKEND
+        for name in names:
+            if not BACKENDS[name]().is_available():
+                report(f"{name:<8} indisponível nesta máquina")
+                continue
+            config.RAYCAST_BACKEND = name
+            for resolution in self.resolutions:
+                for level in self.levels:
+                    result = self.run_case(level, self.qualities[0], resolution)
+                    result['backend'] = name
+                    results.append(result)
+                    totals[name] = totals.get(name, 0.0) + result['p50_ms']
+                    report(f"{name:<8} {format_result(result)}")
+        config.RAYCAST_BACKEND = requested
+        ranking = sorted(totals, key=totals.get)
+        for place, name in enumerate(ranking, 1):
+            report(f"{place}. {name:<8} p50 somado {totals[name]:8.2f} ms  ({totals[name] / totals[ranking[0]]:.2f}x o mais rápido)")
+        return results
+
+def measure_startup(runs=5):
+    # Cada execução é um processo novo (main.py --startup-report json); o relógio começa antes do spawn
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy')
+    results = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        process = subprocess.Popen([sys.executable, 'main.py', '--startup-report', 'json'], stdout=subprocess.PIPE, text=True, env=env)
+        report = None
+        for line in process.stdout:
+            if line.startswith('{'):
+                report = json.loads(line)
+                report['process_ms'] = (time.perf_counter() - start) * 1000
+                break
+        process.stdout.read()
+        process.wait()
+        if report is None: raise RuntimeError('main.py não gerou o relatório de inicialização')
+        results.append(report)
+    return results
+
+def case_key(result):
+    return f"{result['level']}/{result['quality']}/{result['resolution']}"
+
+def format_result(result):
+    return (f"{case_key(result):<22} p50 {result['p50_ms']:7.2f} ms  p95 {result['p95_ms']:7.2f} ms  "
+            f"p99 {result['p99_ms']:7.2f} ms  {result['rays_per_sec'] / 1e6:6.2f} Mrays/s")
+
+def compare_with_baseline(results, baseline, tolerance):
+    regressions = []
+    for result in results:
+        reference = baseline.get(case_key(result))
+        if not reference: continue
+        limit = reference['p95_ms'] * (1 + tolerance)
+        if result['p95_ms'] > limit:
+            regressions.append(f"{case_key(result)}: p95 {result['p95_ms']:.2f} ms > {limit:.2f} ms (baseline {reference['p95_ms']:.2f} ms)")
+    return regressions
+
+def parse_resolution(text):
+    w, h = text.lower().split('x')
+    return int(w), int(h)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark headless do renderer de Labirintity')
+    parser.add_argument('--frames', type=int, default=120)
+    parser.add_argument('--warmup', type=int, default=5)
+    parser.add_argument('--levels', type=int, nargs='*')
+    parser.add_argument('--qualities', nargs='*', choices=QUALITIES)
+    parser.add_argument('--resolutions', type=parse_resolution, nargs='*')
+    parser.add_argument('--baseline', default=os.path.join(config.CACHE_DIR, 'bench_baseline.json'),
+                        help='tempos de referência desta máquina (padrão fora do git, em config.CACHE_DIR)')
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--tolerance', type=float, default=0.10, help='regressão aceita no p95 (fração)')
+    parser.add_argument('--output', help='grava os resultados em JSON')
+    parser.add_argument('--scaling', action='store_true', help='mede speedup por número de workers (1600x900 e 1920x1080)')
+    parser.add_argument('--startup', type=int, nargs='?', const=5, metavar='RUNS',
+                        help='mede o cold start (processo novo até o primeiro quadro do menu) contra config.STARTUP_BUDGET_MS')
+    parser.add_argument('--maze-scaling', type=int, nargs='*', metavar='SIZE',
+                        help='mede geração, render e colisão em labirintos gerados (padrão: 50 250 500 1000 2000)')
+    parser.add_argument('--ray-skip', type=int, nargs='*', metavar='SIZE',
+                        help='compara o DDA com o salto de espaço vazio nos níveis e em labirintos gerados (padrão: 500 2000)')
+    parser.add_argument('--repeats', type=int, default=7, help='rodadas por modo no --ray-skip (vale a mediana)')
+    parser.add_argument('--sprites', type=int, nargs='*', metavar='COUNT',
+                        help='mede o quadro com N sprites no nível (padrão: 0 100 300 600)')
+    parser.add_argument('--render-scale', type=float, nargs='*', metavar='SCALE',
+                        help='mede o quadro por escala do passe do mundo em 1920x1080 (padrão: 1.0 0.75 0.67 0.5)')
+    parser.add_argument('--backends', nargs='*', choices=list(BACKENDS), metavar='NAME',
+                        help='classifica os backends do passe de paredes nesta máquina (padrão: todos)')
+    parser.add_argument('--replay', metavar='LOG', help='mede o traço de quadros de uma partida gravada (main.py --record)')
+    args = parser.parse_args(argv)
+
+    if args.backends is not None:
+        bench = RenderBenchmark(args.frames, args.warmup, args.levels or [3], args.qualities or ['high'], args.resolutions or [(1600, 900)])
+        results = bench.run_backends(args.backends or list(BACKENDS))
+        if args.output:
+            with open(args.output, 'w') as f: json.dump(results, f, indent=2)
+        return 0
+
+    if args.render_scale is not None:
+        bench = RenderBenchmark(args.frames, args.warmup, args.levels or [3], args.qualities or ['high'], args.resolutions or [(1920, 1080)])
+        results = bench.run_render_scale(args.render_scale or [1.0, 0.75, 0.67, 0.5])
+        if args.output:
+            with open(args.output, 'w') as f: json.dump(results, f, indent=2)
+        return 0
+
+    if args.replay:
+        bench = RenderBenchmark(args.frames, args.warmup, None, args.qualities or ['high'], args.resolutions or [(1600, 900)])
+        bench.game.change_resolution(*bench.resolutions[0])
+        bench.game.set_graphics_quality(bench.qualities[0])
+        result = replay_session(bench.game, args.replay)
+        print(format_replay(result))
+        if args.output:
+            with open(args.output, 'w') as f: json.dump(result, f, indent=2)
+        return 1 if result['check'] is False else 0
+
+    if args.sprites is not None:
+        bench = RenderBenchmark(args.frames, args.warmup, args.levels or [3], args.qualities or ['high'], args.resolutions or [(1600, 900)])
+        results = bench.run_sprite_load(args.sprites or [0, 100, 300, 600])
+        if args.output:
+            with open(args.output, 'w') as f: json.dump(results, f, indent=2)
+        return 0
+
+    if args.ray_skip is not None:
+        bench = RenderBenchmark(args.frames, args.warmup, args.levels or [3, 4], args.qualities or ['high'], args.resolutions or [(1600, 900)])
+        results = bench.run_ray_skip(args.ray_skip or [500, 2000], repeats=args.repeats)
+        if args.output:
+            with open(args.output, 'w') as f: json.dump(results, f, indent=2)
+        return 0 if all(r['identical'] for r in results) else 1
+
+    if args.maze_scaling is not None:
+        bench = RenderBenchmark(args.frames, args.warmup, None, args.qualities or ['high'], args.resolutions or [(1600, 900)])
+        results = bench.run_maze_scaling(args.maze_scaling or [50, 250, 500, 1000, 2000])
+        if args.output:
+            with open(args.output, 'w') as f: json.dump(results, f, indent=2)
+        return 0
+
+    if args.startup:
+        results = measure_startup(args.startup)
+        for result in results:
+            stages = '  '.join(f"{name} {ms:.0f}" for name, ms in result['stages_ms'].items())
+            print(f"processo {result['process_ms']:7.1f} ms  interno {result['total_ms']:7.1f} ms  ({stages})")
+        median_ms = float(np.median([r['process_ms'] for r in results]))
+        print(f"Mediana {median_ms:.1f} ms, orçamento {config.STARTUP_BUDGET_MS} ms")
+        if args.output:
+            with open(args.output, 'w') as f: json.dump(results, f, indent=2)
+        return 0 if median_ms <= config.STARTUP_BUDGET_MS else 1
+
+    if args.scaling:
+        bench = RenderBenchmark(args.frames, args.warmup, args.levels or [3], ['high'], args.resolutions or [(1600, 900), (1920, 1080)])
+        cores = os.cpu_count() or 1
+        worker_counts = sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1))) if cores > 1 else [1, 2]
+        results = bench.run_scaling(worker_counts)
+        if args.output:
+            with open(args.output, 'w') as f: json.dump(results, f, indent=2)
+        return 0
+
+    bench = RenderBenchmark(args.frames, args.warmup, args.levels, args.qualities, args.resolutions)
+    results = bench.run()
+
+    if args.output:
+        with open(args.output, 'w') as f: json.dump(results, f, indent=2)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline) or '.', exist_ok=True)
+        with open(args.baseline, 'w') as f: json.dump({case_key(r): r for r in results}, f, indent=2)
+        print(f"Baseline salvo em '{args.baseline}'")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"Sem baseline em '{args.baseline}'; use --save-baseline para criar um.")
+        return 0
+    with open(args.baseline) as f: baseline = json.load(f)
+    regressions = compare_with_baseline(results, baseline, args.tolerance)
+    for line in regressions: print('REGRESSÃO', line)
+    if not regressions: print('Sem regressões em relação ao baseline.')
+    return 1 if regressions else 0
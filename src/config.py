@@ -10,8 +10,10 @@ ROTATION_R = 0.0
 
 # Configurações de movimento
 PRECISION = 0.1
-MOVE_SPEED = 0.09
-SENSITIVITY = 0.05
+MOVE_SPEED = 5.4  # tiles por segundo
+SENSITIVITY = 3.0  # radianos por segundo
+TICK_RATE = 120  # passos fixos de simulação por segundo, independentes do FPS do render
+MAX_TICKS_PER_FRAME = 12  # abaixo de TICK_RATE / 12 FPS a simulação desacelera em vez de acumular atraso
 
 # Configurações de raycasting
 FOV = 80
@@ -21,14 +23,50 @@ MAX_DEPTH = 15
 WALL_HEIGHT = 800
 MAX_WALL_HEIGHT = WIN_HEIGHT * 1.5
 
+# Escala do passe do mundo em relação à tela (ex.: 0.5 em 1920x1080 desenha 960x540 e amplia); HUD sempre nativo
+RENDER_SCALE = 1.0
+RENDER_SCALES = (0.5, 0.67, 0.75, 1.0)
+RENDER_SCALE_SMOOTH = False  # True amplia com smoothscale (~7 ms a mais em 1080p); False usa scale (vizinho mais próximo)
+
+# Backend do passe de paredes: 'python' (referência escalar), 'numpy' (raios em lote) ou 'numba' (se instalado)
+RAYCAST_BACKEND = 'numpy'
+RAYCAST_FALLBACK = ('numpy', 'python')  # ordem tentada quando o pedido não está disponível
+RENDER_WORKERS = 1  # Threads do passe de paredes em faixas (0 = um por núcleo); ajustado pelos presets
+WALL_RENDER_MODE = 'buffer'  # 'buffer' (NumPy, um blit por frame) ou 'columns' (subsurface/scale por coluna)
+
+# Resolução dinâmica (preset 'auto'): o governador move COLUMN_WIDTH pelo tempo de quadro
+DYNAMIC_RESOLUTION = False
+GOVERNOR_TARGET_MS = None  # None = 1000 / FPS (60 se FPS = 0)
+GOVERNOR_WINDOW = 30  # quadros por decisão
+GOVERNOR_UPPER = 1.0  # engrossa acima de orçamento * UPPER
+GOVERNOR_LOWER = 0.8  # refina só se o custo estimado ficar abaixo de orçamento * LOWER
+GOVERNOR_COLUMN_WIDTHS = (1, 2, 4, 5, 8)
+GOVERNOR_LOG = False  # imprime cada decisão
+
 # Configurações de renderização e textura
 TEXTURE_SIZE = 128
 TEXTURE_SCALE_FACTOR = 1.0
+FLOOR_CASTING = True  # Chão e teto texturizados (apenas no modo 'buffer')
+FLOOR_CAST_BUDGET_MS = 6.0
+SPRITES_ENABLED = True  # itens, marcador de saída e decorações (nos dois modos de WALL_RENDER_MODE)
+SPRITE_DENSITY = 0.0  # fração das células vazias com item ou planta decorativo (0 = só os marcadores de saída)
+MAX_LEVEL_SPRITES = 400
+
+# Minimapa (tecla M alterna 'off', 'corner' e 'full')
+MINIMAP_MODE = 'corner'
+MINIMAP_CELL_PX = 6  # pixels por célula no modo canto
+MINIMAP_MAX_SURFACE = 4096  # lado máximo da superfície de detalhe; mapas grandes usam menos pixels por célula
+MINIMAP_CORNER_SIZE = 240
+MINIMAP_FLOOR_RAYS = 160  # raios que marcam o chão como explorado (as paredes usam todos os raios)
+
+# Seta de dica apontando o caminho mais curto até a saída (tecla H)
+EXIT_HINT = False
 
 # Configurações de shading
 MIN_SHADE = 0.2
 SIDE_SHADE_FACTOR = 0.7
 FOG_DISTANCE = 15
+SHADE_LEVELS = 32
 
 # Cores base das paredes
 BRICK_COLOR = (150, 100, 70)   # Tijolo
@@ -43,11 +81,10 @@ CEILING_COLOR = (7, 32, 59)
 # Controles
 W_KEY = S_KEY = A_KEY = D_KEY = False
 
-# Configurações do pygame
-pygame.init()
-DISPLAY = pygame.display.set_mode((WIN_WIDTH, WIN_HEIGHT))
+# Configurações do pygame (a janela só é criada em init_display, não ao importar)
+DISPLAY = None
 CLOCK = pygame.time.Clock()
-FPS = 60
+FPS = 60  # limite do render (0 = sem limite); a simulação roda em TICK_RATE
 RUNNING = True
 
 # Configurações de otimização
@@ -55,6 +92,40 @@ ENABLE_TEXTURES = True
 TEXTURE_QUALITY = 1.0
 RENDER_DISTANCE = 20
 
+# Configurações de inicialização
+LAZY_STARTUP = True  # texturas por nível sob demanda e chão gerado no primeiro uso
+STARTUP_BUDGET_MS = 1500  # orçamento do início do processo ao primeiro quadro do menu
+FLOOR_TEXTURE_SEED = 1
+CACHE_DIR = '.cache'
+
+# Configurações de níveis (pack binário gerado com python -m src.maps.level_pack)
+LEVEL_PACK_PATH = 'assets/maps/levels.lvl'
+PROCEDURAL_LEVELS = {}  # labirintos gerados, ex.: {5: (501, 501, 7)} = nível 5 com 501x501 tiles e seed 7
+
+# Configurações de profiling (F3 mostra o overlay)
+PROFILER_ENABLED = True
+PROFILER_CAPACITY = 3600
+PROFILER_EXPORT_PATH = None  # ex.: 'profile.jsonl' ou 'profile.csv', gravado ao sair
+
 # Configurações de cache
 MAX_TEXTURE_CACHE_SIZE = 50
 CACHE_CLEANUP_INTERVAL = 100
+FRAME_REUSE = True  # câmera parada reapresenta o último frame (modo 'buffer')
+RAY_CACHE_SIZE = 64  # poses guardadas no LRU de resultados de raios
+EMPTY_SPACE_SKIPPING = True  # DDA salta trechos vazios usando o campo por eixo do nível (mesmos acertos)
+
+# Presets de qualidade: (COLUMN_WIDTH, FOG_DISTANCE, RENDER_WORKERS)
+QUALITY_PRESETS = {'low': (8, 8, 1), 'medium': (4, 12, 2), 'high': (1, 24, 0), 'auto': (4, 24, 0)}
+
+def apply_graphics_quality(quality):
+    global GRAPHICS_QUALITY, DYNAMIC_RESOLUTION, COLUMN_WIDTH, FOG_DISTANCE, RENDER_WORKERS
+    GRAPHICS_QUALITY = quality
+    DYNAMIC_RESOLUTION = quality == 'auto'
+    if quality in QUALITY_PRESETS: COLUMN_WIDTH, FOG_DISTANCE, RENDER_WORKERS = QUALITY_PRESETS[quality]
+
+def init_display():
+    global DISPLAY
+    if DISPLAY is None:
+        pygame.init()
+        DISPLAY = pygame.display.set_mode((WIN_WIDTH, WIN_HEIGHT), pygame.FULLSCREEN if FULLSCREEN else 0)
+    return DISPLAY
@@ -1,24 +1,50 @@
+import json
 import pygame
 from src import config
 from src.player.player import Player
+from src.player.controls import read_keyboard, PRESS_MASK
 from src.maps.maps import Maps
 from src.renderer.renderer import Renderer
 from src.renderer.texture_manager import TextureManager
+from src.renderer.frame_governor import FrameGovernor
+from src.renderer.sprites import place_level_sprites
 from src.ui.ui_manager import UIManager
+from src.ui.profiler_overlay import ProfilerOverlay
+from src.replay.input_log import InputRecorder
+from src.profiler.profiler import profiler
+from src.profiler.startup import startup_timer, format_report
 
 class Game:
-    def __init__(self):
+    def __init__(self, startup_report=None, record_path=None):
+        config.init_display()
+        startup_timer.mark('display')
         self.maps = Maps()
+        startup_timer.mark('maps')
         self.texture_manager = TextureManager()
+        startup_timer.mark('textures')
         self.running = True
+        # 'text' ou 'json': imprime o relatório de inicialização e sai após o primeiro quadro do menu
+        self.startup_report = startup_report
+        # Gravação da partida (src.replay): teclas e duração de cada quadro jogado
+        self.recorder = InputRecorder(record_path) if record_path else None
 
         self.current_level = 0
         self.map = self.maps.get_map(self.current_level)
         if self.map is None: raise ValueError(f"Mapa para o nível {self.current_level} não encontrado!")
-        self.player = Player(self.current_level)
+        self.player = Player(self.current_level, self.maps)
+        # Tempo de jogo ainda não simulado; consumido em ticks fixos de 1 / TICK_RATE
+        self.tick_accumulator = 0.0
+        self.frame_ms = 0
+        self.frame_seconds = 0.0
+        # Teclas de um toque ainda não consumidas por um tick
+        self.pending_keys = 0
         
         self.renderer = Renderer(config.DISPLAY, self)
+        self.governor = FrameGovernor(self.renderer)
+        startup_timer.mark('renderer')
         self.ui_manager = UIManager(self)
+        self.profiler_overlay = ProfilerOverlay(profiler)
+        startup_timer.mark('ui')
 
         self.state_stack = ['main_menu']
         self.transition_start_time = 0 
@@ -30,31 +56,58 @@ class Game:
 
     def run(self):
         while self.running:
-            config.CLOCK.tick(config.FPS)
+            self.frame_ms = config.CLOCK.tick(config.FPS)
+            self.frame_seconds = self.frame_ms / 1000
+            profiler.begin_frame()
             events = pygame.event.get()
+            for event in events:
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    profiler.overlay_visible = not profiler.overlay_visible
             current_state = self.get_current_state()
-            self.update_states(events, current_state)
+            if config.DYNAMIC_RESOLUTION and current_state == 'playing':
+                decision = self.governor.update(config.CLOCK.get_rawtime())
+                if decision and config.GOVERNOR_LOG:
+                    print(f"Governador: coluna {decision['from_width']} -> {decision['to_width']} "
+                          f"({decision['average_ms']:.1f} ms, alvo {decision['target_ms']:.1f} ms, {decision['reason']})")
+            with profiler.span('update_states'):
+                self.update_states(events, current_state)
 
             if current_state == 'playing':
-                self.renderer.render_game_world()
+                with profiler.span('render_world'):
+                    self.renderer.render_game_world()
             
-            self.ui_manager.draw(config.DISPLAY, current_state)
+            with profiler.span('ui_draw'):
+                self.ui_manager.draw(config.DISPLAY, current_state)
+            if profiler.overlay_visible:
+                self.profiler_overlay.draw(config.DISPLAY)
 
             # pygame.display.set_caption(f"FPS: {int(config.CLOCK.get_fps())}")
             pygame.display.set_caption('Labirintity')
-            pygame.display.flip()
+            with profiler.span('flip'):
+                pygame.display.flip()
+            if current_state == 'main_menu' and startup_timer.report is None:
+                self.finish_startup()
+        if self.recorder: self.recorder.close(self.player)
+        if config.PROFILER_EXPORT_PATH:
+            profiler.export(config.PROFILER_EXPORT_PATH, self.texture_manager, self.renderer.view_cache, self.governor)
         pygame.quit()
 
+    def finish_startup(self):
+        report = startup_timer.finish(config.STARTUP_BUDGET_MS, config.LAZY_STARTUP)
+        if self.startup_report:
+            print(json.dumps(report) if self.startup_report == 'json' else format_report(report))
+            self.running = False
+
     def update_states(self, events, state):
         if state in ['main_menu', 'options_main', 'options_resolution', 'options_graphics', 'paused', 'how_to_play']:
             self.ui_manager.handle_events(events, state)
         elif state == 'playing':
             self.handle_playing_events(events)
-            for event in events:
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_f:
-                    self.player.handle_interaction_key()
+            keys = read_keyboard(events)
+            if self.recorder: self.recorder.frame(self.frame_ms, keys)
 
-            player_status = self.player.update()
+            with profiler.span('player_update'):
+                player_status = self.run_ticks(self.frame_seconds, keys)
             if player_status == 'goal_reached':
                 self.start_level_transition()
         elif state == 'level_transition':
@@ -66,6 +119,22 @@ class Game:
                 if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
                     self.pop_state()
 
+    def run_ticks(self, frame_seconds, keys=0):
+        # Simulação em passo fixo: o mesmo número de ticks por segundo em máquina lenta ou rápida.
+        # Só depende de frame_seconds e keys, então o replay reproduz a partida com os mesmos dois valores
+        tick = 1 / config.TICK_RATE
+        self.tick_accumulator = min(self.tick_accumulator + frame_seconds, tick * config.MAX_TICKS_PER_FRAME)
+        self.pending_keys |= keys & PRESS_MASK
+        while self.tick_accumulator >= tick:
+            self.tick_accumulator -= tick
+            tick_keys = (keys & ~PRESS_MASK) | self.pending_keys
+            self.pending_keys = 0
+            if self.player.update(tick, tick_keys) == 'goal_reached':
+                self.tick_accumulator = 0.0
+                return 'goal_reached'
+        self.player.alpha = self.tick_accumulator / tick
+        return None
+
     def handle_playing_events(self, events):
         for event in events:
             if event.type == pygame.QUIT:
@@ -74,12 +143,14 @@ class Game:
                 if event.key == pygame.K_ESCAPE:
                     self.ui_manager.pause_background = config.DISPLAY.copy()
                     self.push_state('paused')
-                if event.key == pygame.K_f:
-                    self.player.handle_interaction_key()
+                if event.key == pygame.K_m:
+                    self.ui_manager.minimap.cycle_mode()
+                if event.key == pygame.K_h:
+                    config.EXIT_HINT = not config.EXIT_HINT
     
     def start_level_transition(self):
         self.change_state('level_transition')
-        self.ui_manager.load_gif_frames('assets/loading/door.gif')
+        self.maps.prefetch(self.current_level + 1)
         self.ui_manager.loading_frame_index = 0
         self.ui_manager.gif_animation_finished = False
 
@@ -100,7 +171,7 @@ class Game:
 
     def start_next_level(self):
         self.current_level += 1
-        if not self.maps.get_map(self.current_level):
+        if self.maps.get_map(self.current_level) is None:
             self.change_state('credits')
             self.ui_manager.credits_scroll_y = config.WIN_HEIGHT
             return
@@ -108,8 +179,13 @@ class Game:
 
     def reset_level(self):
         self.map = self.maps.get_map(self.current_level)
-        self.player = Player(self.current_level)
+        self.player = Player(self.current_level, self.maps)
+        self.tick_accumulator = 0.0
+        self.pending_keys = 0
+        if self.recorder: self.recorder.level(self.current_level)
+        self.texture_manager.use_level_textures(self.maps.get_texture_ids(self.current_level))
         self.renderer.player = self.player
+        place_level_sprites(self.renderer.sprites, self.player.map, self.current_level)
         self.renderer.texture_column_cache.clear()
 
     def toggle_fullscreen(self):
@@ -124,18 +200,30 @@ class Game:
         self.ui_manager.create_all_menus()
 
     def set_graphics_quality(self, quality):
-        config.GRAPHICS_QUALITY = quality
-        if quality == 'low': config.COLUMN_WIDTH = 8; config.FOG_DISTANCE = 8
-        elif quality == 'medium': config.COLUMN_WIDTH = 4; config.FOG_DISTANCE = 12
-        elif quality == 'high': config.COLUMN_WIDTH = 1; config.FOG_DISTANCE = 24
+        config.apply_graphics_quality(quality)
+        self.governor.reset()
         self.renderer.setup_optimizations()
         self.ui_manager.create_all_menus()
 
+    def set_render_scale(self, scale):
+        config.RENDER_SCALE = scale
+        self.governor.reset()
+        self.renderer.setup_optimizations()
+        self.ui_manager.create_all_menus()
+
+    def cycle_render_scale(self):
+        scales = config.RENDER_SCALES
+        next_index = (scales.index(config.RENDER_SCALE) + 1) % len(scales) if config.RENDER_SCALE in scales else len(scales) - 1
+        self.set_render_scale(scales[next_index])
+
     def resume_game(self):
         self.pop_state()
 
     def quit_game(self):
         self.running = False
+        self.renderer.strip_pool.shutdown()
+        self.maps.shutdown()
+        self.ui_manager.transition_animation.shutdown()
 
     def return_to_main_menu(self):
         self.change_state('main_menu')
@@ -0,0 +1,55 @@
+import math
+import numpy as np
+from src.maps.maze_generator import EXIT_TILE
+
+UNREACHABLE = -1
+
+class ExitField:
+    # Distância em passos (4 vizinhos) de cada célula vazia até a saída, calculada uma vez por nível.
+    # Só depende de onde é chão: marcar uma parede troca um tile não vazio por outro e não invalida o campo.
+    def __init__(self, grid):
+        grid = np.asarray(grid)
+        self.height, self.width = grid.shape
+        # Borda de paredes em volta: os vizinhos de qualquer célula interna caem dentro do array achatado
+        stride = self.width + 2
+        passable = np.zeros((self.height + 2, stride), dtype=bool)
+        passable[1:-1, 1:-1] = grid == 0
+        passable = passable.ravel()
+        offsets = np.array([1, -1, stride, -stride])
+
+        distance = np.full(passable.size, UNREACHABLE, dtype=np.int32)
+        exits = np.flatnonzero(np.pad(grid == EXIT_TILE, 1).ravel())
+        distance[exits] = 0
+        # Dono de cada célula na onda atual, para descartar repetidas sem ordenar (np.unique)
+        owner = np.zeros(passable.size, dtype=np.int64)
+        frontier, step = exits, 0
+        # Busca em largura por ondas: cada passo expande a fronteira inteira de uma vez
+        while frontier.size:
+            step += 1
+            around = (frontier[:, None] + offsets).ravel()
+            around = around[passable[around] & (distance[around] == UNREACHABLE)]
+            order = np.arange(around.size)
+            owner[around] = order
+            frontier = around[owner[around] == order]
+            distance[frontier] = step
+        self.distance = distance.reshape(self.height + 2, stride)[1:-1, 1:-1].copy()
+        self.longest = step - 1
+
+    def get_distance(self, x, y):
+        if not (0 <= x < self.width and 0 <= y < self.height): return UNREACHABLE
+        return int(self.distance[y, x])
+
+    def next_cell(self, x, y):
+        # Vizinho mais perto da saída a partir da célula (x, y); None se ela não alcança a saída
+        best, here = None, self.get_distance(x, y)
+        if here <= 0: return None
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            distance = self.get_distance(nx, ny)
+            if distance != UNREACHABLE and distance < here: best, here = (nx, ny), distance
+        return best
+
+    def get_hint(self, x, y):
+        # Ângulo do mundo para o centro do próximo passo e quantos passos faltam
+        cell = self.next_cell(int(x), int(y))
+        if cell is None: return None
+        return math.atan2(cell[1] + 0.5 - y, cell[0] + 0.5 - x), self.get_distance(int(x), int(y))
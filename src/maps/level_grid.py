@@ -0,0 +1,38 @@
+import itertools
+
+# Versões únicas entre todas as grades, para caches não confundirem jogadores diferentes
+_versions = itertools.count(1)
+
+class LevelGrid:
+    def __init__(self, base, skip_field=None):
+        self.base = base
+        self.height, self.width = base.shape
+        self.marks = {}
+        # Registro (x, y) de cada tile alterado, só cresce; o minimapa lê a partir de onde parou
+        self.changes = []
+        # Enquanto não houver marcas a grade é o próprio array compartilhado; a primeira marca faz a cópia
+        self.grid = base
+        # Campo de saltos do raycaster (SkipField), também compartilhado até uma marca mudar o que é vazio
+        self.base_skip_field = skip_field
+        self.skip_field = skip_field
+        self.version = next(_versions)
+
+    def in_bounds(self, x, y):
+        return 0 <= y < self.height and 0 <= x < self.width
+
+    def get_tile(self, x, y):
+        return int(self.grid[y, x])
+
+    def set_tile(self, x, y, value):
+        if self.grid is self.base:
+            self.grid = self.base.copy()
+        was_empty = self.grid[y, x] == 0
+        self.grid[y, x] = value
+        self.changes.append((x, y))
+        if value == self.base[y, x]: self.marks.pop((x, y), None)
+        else: self.marks[(x, y)] = value
+        if self.skip_field is not None and was_empty != (value == 0):
+            if self.skip_field is self.base_skip_field: self.skip_field = self.skip_field.copy()
+            self.skip_field.update_tile(self.grid, x, y)
+        if not self.marks: self.grid, self.skip_field = self.base, self.base_skip_field
+        self.version = next(_versions)
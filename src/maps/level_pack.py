@@ -0,0 +1,118 @@
+import mmap
+import os
+import sys
+import numpy as np
+
+MAGIC = b'LVPK'
+VERSION = 1
+MAX_TEXTURE_IDS = 16
+EXIT_TILE = 9
+
+# Cabeçalho do arquivo, seguido da tabela de níveis (ordenada por nível) e das grades uint8 cruas (linha a linha)
+PACK_HEADER = np.dtype([('magic', 'S4'), ('version', '<u4'), ('count', '<u4')])
+LEVEL_ENTRY = np.dtype([
+    ('level', '<u4'),
+    ('spawn_x', '<f4'), ('spawn_y', '<f4'), ('spawn_rot', '<f4'),
+    ('width', '<u4'), ('height', '<u4'),
+    ('offset', '<u8'),
+    ('texture_ids', 'u1', (MAX_TEXTURE_IDS,)),
+])
+
+def level_texture_ids(grid):
+    # Paredes do nível, suas versões marcadas (tipo * 11) e a saída
+    walls = [int(v) for v in np.unique(grid) if 0 < v < EXIT_TILE]
+    ids = sorted(set(walls) | {v * 11 for v in walls} | ({EXIT_TILE} if (grid == EXIT_TILE).any() else set()))
+    return ids[:MAX_TEXTURE_IDS]
+
+def write_level_pack(path, levels):
+    # levels: {nível: (grade, (x, y, rot))}
+    order = sorted(levels)
+    entries = np.zeros(len(order), dtype=LEVEL_ENTRY)
+    grids = []
+    offset = PACK_HEADER.itemsize + entries.nbytes
+    for entry, level in zip(entries, order):
+        grid, (x, y, rot) = levels[level]
+        grid = np.ascontiguousarray(grid, dtype=np.uint8)
+        ids = level_texture_ids(grid)
+        entry['level'] = level
+        entry['spawn_x'], entry['spawn_y'], entry['spawn_rot'] = x, y, rot
+        entry['height'], entry['width'] = grid.shape
+        entry['offset'] = offset
+        entry['texture_ids'][:len(ids)] = ids
+        grids.append(grid)
+        offset += grid.nbytes
+
+    header = np.array((MAGIC, VERSION, len(order)), dtype=PACK_HEADER)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(header.tobytes())
+        f.write(entries.tobytes())
+        for grid in grids: f.write(grid.tobytes())
+
+class LevelPack:
+    def __init__(self, path):
+        # Abrir custa o mesmo para qualquer tamanho de pack: só o mapeamento e visões sobre ele, nada é lido antes do uso
+        with open(path, 'rb') as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = np.frombuffer(self.buffer, dtype=PACK_HEADER, count=1)[0]
+        if header['magic'] != MAGIC or header['version'] != VERSION:
+            raise ValueError(f"Pack de níveis inválido: '{path}'")
+        self.entries = np.frombuffer(self.buffer, dtype=LEVEL_ENTRY, count=int(header['count']), offset=PACK_HEADER.itemsize)
+        self.level_ids = self.entries['level']
+        self.path = path
+
+    def find(self, level):
+        index = int(np.searchsorted(self.level_ids, level))
+        if index < len(self.level_ids) and self.level_ids[index] == level:
+            return self.entries[index]
+        return None
+
+    def get_levels(self):
+        return self.level_ids.tolist()
+
+    def get_grid(self, level):
+        entry = self.find(level)
+        if entry is None: return None
+        shape = (int(entry['height']), int(entry['width']))
+        # Visão somente leitura direto sobre o mmap; as páginas só são lidas quando tocadas
+        return np.ndarray(shape, dtype=np.uint8, buffer=self.buffer, offset=int(entry['offset']))
+
+    def get_spawn(self, level):
+        entry = self.find(level)
+        return float(entry['spawn_x']), float(entry['spawn_y']), float(entry['spawn_rot'])
+
+    def get_texture_ids(self, level):
+        ids = self.find(level)['texture_ids']
+        return [int(v) for v in ids if v]
+
+    def validate(self, level):
+        entry = self.find(level)
+        height, width = int(entry['height']), int(entry['width'])
+        if height == 0 or width == 0 or int(entry['offset']) + height * width > len(self.buffer):
+            raise ValueError(f"Nível {level} corrompido no pack '{self.path}'")
+        # Percorrer a grade inteira também traz as páginas do disco antes de o nível ser usado
+        return validate_grid(level, self.get_grid(level), self.get_spawn(level))
+
+def validate_grid(level, grid, spawn):
+    height, width = grid.shape
+    if not np.isin(grid, np.arange(EXIT_TILE + 1)).all():
+        raise ValueError(f"Nível {level} tem tiles desconhecidos")
+    if not (grid == EXIT_TILE).any():
+        raise ValueError(f"Nível {level} não tem saída")
+    x, y, _ = spawn
+    if not (0 <= int(y) < height and 0 <= int(x) < width) or grid[int(y), int(x)] != 0:
+        raise ValueError(f"Nível {level} tem spawn fora de uma célula livre")
+    return grid
+
+def build_builtin_pack(path):
+    from src import config
+    from src.maps.builtin_levels import LEVELS
+    spawn = (config.X_POSITION, config.Y_POSITION, config.ROTATION_R)
+    write_level_pack(path, {level: (grid, spawn) for level, grid in LEVELS.items()})
+
+if __name__ == '__main__':
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    from src import config
+    path = sys.argv[1] if len(sys.argv) > 1 else config.LEVEL_PACK_PATH
+    build_builtin_pack(path)
+    print(f"Pack de níveis salvo em '{path}'")
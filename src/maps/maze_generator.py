@@ -0,0 +1,41 @@
+import numpy as np
+
+EXIT_TILE = 9
+WALL_TYPES = (1, 2, 3, 4)
+
+def generate_maze(width, height, seed=0, wall_types=WALL_TYPES, region_size=16):
+    # Labirinto perfeito (sidewinder) em grade width x height: células nas posições ímpares, paredes entre elas.
+    # Toda célula alcança todas as outras, então a saída sempre tem caminho a partir do spawn (célula 0, 0).
+    if width < 3 or height < 3: raise ValueError("O labirinto precisa de pelo menos 3x3 tiles")
+    rng = np.random.default_rng(seed)
+    cells_x, cells_y = (width - 1) // 2, (height - 1) // 2
+
+    # Cada célula fecha sua sequência para leste com 50%; a última coluna sempre fecha.
+    # Como toda linha termina fechada, as sequências nunca atravessam linhas e dá para tratar tudo achatado.
+    closes = rng.random((cells_y, cells_x)) < 0.5
+    closes[:, -1] = True
+    closes[0] = False
+    closes[0, -1] = True
+    flat = closes.ravel()
+    ends = np.flatnonzero(flat)
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    # Cada sequência abre uma passagem para o norte a partir de uma célula sorteada dela (exceto na primeira linha)
+    picks = starts + (rng.random(len(ends)) * (ends - starts + 1)).astype(np.int64)
+    north = np.zeros(cells_x * cells_y, dtype=bool)
+    north[picks] = True
+    north = north.reshape(cells_y, cells_x)
+    north[0] = False
+
+    # Paredes por região: blocos de region_size x region_size tiles com um tipo sorteado cada
+    regions = rng.choice(np.asarray(wall_types, dtype=np.uint8), ((height + region_size - 1) // region_size, (width + region_size - 1) // region_size))
+    grid = np.repeat(np.repeat(regions, region_size, axis=0), region_size, axis=1)[:height, :width].copy()
+
+    grid[1:2 * cells_y:2, 1:2 * cells_x:2] = 0
+    east = grid[1:2 * cells_y:2, 2:2 * cells_x + 1:2]
+    east[~closes] = 0
+    above = grid[0:2 * cells_y - 1:2, 1:2 * cells_x:2]
+    above[north] = 0
+
+    # Saída na parede logo abaixo da última célula (canto inferior direito)
+    grid[2 * cells_y, 2 * cells_x - 1] = EXIT_TILE
+    return grid
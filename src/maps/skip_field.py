@@ -0,0 +1,47 @@
+import numpy as np
+
+MAX_RUN = 255
+
+def _runs_forward(empty):
+    # Para cada célula, quantas células vazias seguidas existem logo à frente (+eixo 1) até uma parede ou a borda
+    height, width = empty.shape
+    index = np.arange(width)
+    wall_at = np.where(empty, width, index)
+    # Próxima parede à direita (inclusive a própria célula), varrendo da direita para a esquerda
+    next_wall = np.minimum.accumulate(wall_at[:, ::-1], axis=1)[:, ::-1]
+    ahead = np.empty_like(next_wall)
+    ahead[:, :-1] = next_wall[:, 1:]
+    ahead[:, -1] = width
+    return np.minimum(ahead - index - 1, MAX_RUN).astype(np.uint8)
+
+class SkipField:
+    # Campo de distância por eixo: células vazias livres à frente em cada direção, para o DDA saltar corredores.
+    # Nos níveis de corredores de 1-2 tiles uma distância de Chebyshev seria quase sempre 1; por eixo ela segue o corredor.
+    def __init__(self, grid):
+        self.build(grid)
+
+    def build(self, grid):
+        empty = np.asarray(grid) == 0
+        # Blocos [oeste, leste] e [norte, sul] contíguos: o raycaster indexa a direção pelo sinal do passo
+        self.runs_x = np.stack((_runs_forward(empty[:, ::-1])[:, ::-1], _runs_forward(empty)))
+        self.runs_y = np.stack((_runs_forward(empty[::-1].T).T[::-1], _runs_forward(empty.T).T))
+        self.set_views()
+
+    def set_views(self):
+        self.west, self.east = self.runs_x
+        self.north, self.south = self.runs_y
+
+    def update_tile(self, grid, x, y):
+        # Trocar um tile só muda os saltos da sua linha e da sua coluna
+        empty = np.asarray(grid) == 0
+        row, column = empty[y:y + 1], empty[:, x:x + 1]
+        self.east[y] = _runs_forward(row)[0]
+        self.west[y] = _runs_forward(row[:, ::-1])[0, ::-1]
+        self.south[:, x] = _runs_forward(column.T)[0]
+        self.north[:, x] = _runs_forward(column[::-1].T)[0, ::-1]
+
+    def copy(self):
+        field = SkipField.__new__(SkipField)
+        field.runs_x, field.runs_y = self.runs_x.copy(), self.runs_y.copy()
+        field.set_views()
+        return field
@@ -0,0 +1,21 @@
+import pygame
+
+# Estado de entrada de um quadro em 7 bits: é o que a simulação lê e o que a gravação guarda
+KEY_W, KEY_S, KEY_Q, KEY_A, KEY_D, KEY_E, KEY_F = (1 << bit for bit in range(7))
+# Teclas seguradas, lidas de pygame.key.get_pressed()
+HELD_KEYS = ((pygame.K_w, KEY_W), (pygame.K_s, KEY_S), (pygame.K_q, KEY_Q), (pygame.K_a, KEY_A),
+             (pygame.K_d, KEY_D), (pygame.K_e, KEY_E))
+# Teclas de um toque (KEYDOWN): valem para um único tick, mesmo que o quadro não rode nenhum
+PRESS_KEYS = ((pygame.K_f, KEY_F),)
+PRESS_MASK = KEY_F
+
+def read_keyboard(events):
+    pressed = pygame.key.get_pressed()
+    keys = 0
+    for key, bit in HELD_KEYS:
+        if pressed[key]: keys |= bit
+    for event in events:
+        if event.type == pygame.KEYDOWN:
+            for key, bit in PRESS_KEYS:
+                if event.key == key: keys |= bit
+    return keys
@@ -1,21 +1,25 @@
 import math
-import pygame
 from src import config
+from src.player.controls import KEY_W, KEY_S, KEY_Q, KEY_A, KEY_D, KEY_E, KEY_F
 from src.maps.maps import Maps
+from src.maps.level_grid import LevelGrid
+from src.profiler.profiler import profiler
 
 class Player:
-    def __init__(self, lvl):
-        self.x = config.X_POSITION
-        self.y = config.Y_POSITION
-        self.rot = config.ROTATION_R
+    def __init__(self, lvl, maps=None):
+        self.maps = maps or Maps()
+        self.level_grid = LevelGrid(self.maps.get_map(lvl), self.maps.get_skip_field(lvl))
+        self.x, self.y, self.rot = self.maps.get_spawn(lvl)
+        # Pose do tick anterior e fração do tick atual já decorrida, para o render interpolar entre as duas
+        self.prev_x, self.prev_y, self.prev_rot = self.x, self.y, self.rot
+        self.alpha = 1.0
         self.speed = config.MOVE_SPEED
         self.sensitivity = config.SENSITIVITY
-        self.maps = Maps()
-        self.map = [row[:] for row in self.maps.get_map(lvl)]
         self.collision_radius = 0.3
         self.marks_left = 5
         
         self.interaction_target = None
+        # Ticks restantes do aviso de marcações esgotadas (contado na simulação, não no relógio, para o replay)
         self.prompt_timer = 0
     
     def handle_interaction_key(self):
@@ -25,40 +29,61 @@ class Player:
             
             if 0 < target_type < 9:
                 if self.marks_left > 0:
-                    self.map[target_pos[1]][target_pos[0]] = target_type * 11
+                    self.level_grid.set_tile(target_pos[0], target_pos[1], target_type * 11)
                     self.marks_left -= 1
                     self.interaction_target = None
                 else:
-                    self.prompt_timer = pygame.time.get_ticks() + 2000
+                    self.prompt_timer = 2 * config.TICK_RATE
             
             elif target_type > 10 and target_type % 11 == 0:
                 original_type = target_type // 11
-                self.map[target_pos[1]][target_pos[0]] = original_type
+                self.level_grid.set_tile(target_pos[0], target_pos[1], original_type)
                 self.marks_left = min(self.marks_left + 1, 5)
                 self.interaction_target = None
 
-    def update(self):
-        if self.prompt_timer > 0 and pygame.time.get_ticks() > self.prompt_timer:
-            self.prompt_timer = 0
+    @property
+    def map(self):
+        return self.level_grid.grid
 
-        self.check_interaction()
-        keys = pygame.key.get_pressed()
+    @property
+    def map_version(self):
+        return self.level_grid.version
+
+    def get_view_pose(self):
+        if self.alpha >= 1.0: return self.x, self.y, self.rot
+        alpha = self.alpha
+        # Gira pelo menor arco, senão a passagem por 0/2π daria uma volta inteira entre dois ticks
+        turn = (self.rot - self.prev_rot + math.pi) % (2 * math.pi) - math.pi
+        return (self.prev_x + (self.x - self.prev_x) * alpha, self.prev_y + (self.y - self.prev_y) * alpha,
+                (self.prev_rot + turn * alpha) % (2 * math.pi))
+
+    def update(self, dt, keys):
+        # Um tick fixo de simulação (dt em segundos); velocidades do config são por segundo.
+        # keys: máscara de src.player.controls, do teclado ou de um replay
+        self.prev_x, self.prev_y, self.prev_rot = self.x, self.y, self.rot
+        if self.prompt_timer > 0: self.prompt_timer -= 1
+
+        with profiler.span('check_interaction'):
+            self.check_interaction()
         
-        if keys[pygame.K_e] and self.interaction_target:
+        if keys & KEY_E and self.interaction_target:
             if self.interaction_target['type'] == 9:
                 return 'goal_reached'
+        if keys & KEY_F:
+            self.handle_interaction_key()
 
         dx, dy = 0, 0
+        step, turn = self.speed * dt, self.sensitivity * dt
 
-        if keys[pygame.K_w]:
-            dx += self.speed * math.cos(self.rot); dy += self.speed * math.sin(self.rot)
-        if keys[pygame.K_s]:
-            dx -= self.speed * math.cos(self.rot); dy -= self.speed * math.sin(self.rot)
-        if keys[pygame.K_q]:
-            dx += self.speed * math.sin(self.rot); dy -= self.speed * math.cos(self.rot)
+        if keys & KEY_W:
+            dx += step * math.cos(self.rot); dy += step * math.sin(self.rot)
+        if keys & KEY_S:
+            dx -= step * math.cos(self.rot); dy -= step * math.sin(self.rot)
+        if keys & KEY_Q:
+            dx += step * math.sin(self.rot); dy -= step * math.cos(self.rot)
         
-        if keys[pygame.K_a]: self.rot -= self.sensitivity
-        if keys[pygame.K_d]: self.rot += self.sensitivity
+        if keys & KEY_A: self.rot -= turn
+        if keys & KEY_D: self.rot += turn
         self.rot %= (2 * math.pi)
 
         if self.can_move_to(self.x + dx, self.y): self.x += dx
@@ -72,8 +97,8 @@ class Player:
         check_y = self.y + check_dist * math.sin(self.rot)
         map_x, map_y = int(check_x), int(check_y)
 
-        if 0 <= map_y < len(self.map) and 0 <= map_x < len(self.map[0]):
-            tile_type = self.map[map_y][map_x]
+        if self.level_grid.in_bounds(map_x, map_y):
+            tile_type = self.level_grid.get_tile(map_x, map_y)
             if tile_type != 0:
                 self.interaction_target = {'pos': (map_x, map_y), 'type': tile_type}
                 return
@@ -81,13 +106,14 @@ class Player:
         self.interaction_target = None 
 
     def can_move_to(self, x, y):
+        grid = self.level_grid
         for offset_x in [-self.collision_radius, self.collision_radius]:
             for offset_y in [-self.collision_radius, self.collision_radius]:
                 map_x = int(x + offset_x)
                 map_y = int(y + offset_y)
-                if not (0 <= map_y < len(self.map) and 0 <= map_x < len(self.map[0])):
+                if not grid.in_bounds(map_x, map_y):
                     return False
-                if self.map[map_y][map_x] != 0:
+                if grid.grid[map_y, map_x] != 0:
                     return False
         return True
 
@@ -0,0 +1,118 @@
+import csv
+import json
+import time
+import numpy as np
+from src import config
+
+STAGES = ['update_states', 'player_update', 'check_interaction', 'render_world', 'draw_walls', 'upscale', 'ui_draw', 'flip']
+
+class Span:
+    __slots__ = ('profiler', 'index', 'start')
+
+    def __init__(self, profiler, index):
+        self.profiler = profiler
+        self.index = index
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.current[self.index] += time.perf_counter() - self.start
+        return False
+
+class FrameProfiler:
+    def __init__(self, capacity=None):
+        self.stages = list(STAGES)
+        # Sem capacidade pedida, segue config.PROFILER_CAPACITY (relida a cada begin_frame)
+        self.requested_capacity = capacity
+        capacity = capacity or config.PROFILER_CAPACITY
+        self.capacity = capacity
+        # Coluna 0 é o tempo total do frame; as demais seguem a ordem de STAGES
+        self.samples = np.zeros((capacity, len(self.stages) + 1), dtype=np.float64)
+        self.current = np.zeros(len(self.stages) + 1, dtype=np.float64)
+        self.session_totals = np.zeros(len(self.stages) + 1, dtype=np.float64)
+        self.spans = {name: Span(self, i + 1) for i, name in enumerate(self.stages)}
+        self.frame_count = 0
+        self.stored = 0
+        self.frame_start = None
+        self.enabled = config.PROFILER_ENABLED
+        self.overlay_visible = False
+
+    def span(self, name):
+        return self.spans[name]
+
+    def begin_frame(self):
+        if not self.enabled: return
+        if self.requested_capacity is None and config.PROFILER_CAPACITY != self.capacity:
+            self.set_capacity(config.PROFILER_CAPACITY)
+        now = time.perf_counter()
+        if self.frame_start is not None:
+            self.current[0] = now - self.frame_start
+            self.samples[self.frame_count % self.capacity] = self.current
+            self.session_totals += self.current
+            self.frame_count += 1
+            self.stored = min(self.stored + 1, self.capacity)
+        self.current[:] = 0
+        self.frame_start = now
+
+    def set_capacity(self, capacity):
+        # Guarda os quadros mais recentes que couberem; a posição no anel continua sendo frame_count % capacity
+        kept = self.recent(capacity)
+        self.samples = np.zeros((capacity, len(self.stages) + 1), dtype=np.float64)
+        self.samples[np.arange(self.frame_count - len(kept), self.frame_count) % capacity] = kept
+        self.capacity = capacity
+        self.stored = len(kept)
+
+    def recent(self, count=None):
+        count = self.stored if count is None else min(count, self.stored)
+        end = self.frame_count % self.capacity
+        indices = (np.arange(end - count, end)) % self.capacity
+        return self.samples[indices]
+
+    def stage_averages_ms(self, count=60):
+        frames = self.recent(count)
+        if not len(frames): return {}
+        means = frames.mean(axis=0) * 1000
+        return {'frame': means[0], **{name: means[i + 1] for i, name in enumerate(self.stages)}}
+
+    def session_summary(self, texture_manager=None, view_cache=None, governor=None):
+        frames = max(self.frame_count, 1)
+        recent_ms = self.recent()[:, 0] * 1000
+        summary = {
+            'type': 'session',
+            'frames': self.frame_count,
+            'mean_ms': {name: self.session_totals[i + 1] / frames * 1000 for i, name in enumerate(self.stages)},
+            'frame_mean_ms': self.session_totals[0] / frames * 1000,
+            'frame_p95_ms': float(np.percentile(recent_ms, 95)) if len(recent_ms) else 0.0,
+        }
+        if texture_manager is not None:
+            summary['textures'] = texture_manager.get_texture_info()
+        if view_cache is not None:
+            summary['view_cache'] = view_cache.get_stats()
+        if governor is not None:
+            summary['governor_decisions'] = list(governor.decisions)
+        return summary
+
+    def export(self, path, texture_manager=None, view_cache=None, governor=None):
+        frames = self.recent() * 1000
+        first_frame = self.frame_count - len(frames)
+        summary = self.session_summary(texture_manager, view_cache, governor)
+        if path.endswith('.csv'):
+            with open(path, 'w', newline='') as f:
+                for key, value in {**summary.get('textures', {}), **summary.get('view_cache', {})}.items():
+                    f.write(f"# {key}={value}\n")
+                writer = csv.writer(f)
+                writer.writerow(['frame', 'frame_ms'] + [f"{name}_ms" for name in self.stages])
+                for i, row in enumerate(frames):
+                    writer.writerow([first_frame + i] + [f"{value:.4f}" for value in row])
+        else:
+            with open(path, 'w') as f:
+                f.write(json.dumps(summary) + '\n')
+                for i, row in enumerate(frames):
+                    record = {'type': 'frame', 'frame': first_frame + i, 'frame_ms': row[0]}
+                    record.update({f"{name}_ms": row[j + 1] for j, name in enumerate(self.stages)})
+                    f.write(json.dumps(record) + '\n')
+
+profiler = FrameProfiler()
@@ -0,0 +1,41 @@
+import time
+
+# Marco zero: o primeiro import do processo (main.py importa este módulo antes de qualquer outro)
+PROCESS_START = time.perf_counter()
+
+class StartupTimer:
+    def __init__(self, start=PROCESS_START):
+        self.start = start
+        self.marks = []
+        self.report = None
+
+    def mark(self, name):
+        if self.report is None:
+            self.marks.append((name, time.perf_counter()))
+
+    def finish(self, budget_ms, lazy):
+        # Fecha no primeiro quadro do menu; marcas posteriores são ignoradas
+        if self.report is not None: return self.report
+        self.mark('first_menu_frame')
+        stages, previous = {}, self.start
+        for name, moment in self.marks:
+            stages[name] = (moment - previous) * 1000
+            previous = moment
+        total_ms = (previous - self.start) * 1000
+        self.report = {
+            'type': 'startup',
+            'total_ms': total_ms,
+            'budget_ms': budget_ms,
+            'within_budget': total_ms <= budget_ms,
+            'lazy': lazy,
+            'stages_ms': stages,
+        }
+        return self.report
+
+def format_report(report):
+    lines = [f"Inicialização: {report['total_ms']:.1f} ms (orçamento {report['budget_ms']:.0f} ms, "
+             f"{'ok' if report['within_budget'] else 'ESTOURADO'}, modo {'preguiçoso' if report['lazy'] else 'completo'})"]
+    lines += [f"  {name:<18} {ms:8.1f} ms" for name, ms in report['stages_ms'].items()]
+    return '\n'.join(lines)
+
+startup_timer = StartupTimer()
@@ -0,0 +1,178 @@
+import math
+from abc import ABC, abstractmethod
+import numpy as np
+from src import config
+from src.renderer.raycaster import BatchRaycaster
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+class RaycastBackend(ABC):
+    # Implementação do passe de paredes: lançamento dos raios (cast / cast_ray) e preenchimento das colunas.
+    # O preenchimento padrão é o do FrameCompositor; um backend só sobrescreve o que acelera.
+    name = None
+
+    def is_available(self):
+        return True
+
+    @abstractmethod
+    def cast(self, px, py, prot, ray_angles, grid, skip_field=None):
+        pass
+
+    def cast_ray(self, px, py, dx, dy, grid):
+        distances, wall_types, hit_sides, wall_xs = self.cast(px, py, math.atan2(dy, dx), np.zeros(1), grid)
+        return float(distances[0]), int(wall_types[0]), int(hit_sides[0]), float(wall_xs[0])
+
+    def draw_wall_layer(self, compositor, screen, columns, wall_tops, wall_heights, wall_types, bands, wall_xs, lods):
+        compositor.draw_wall_layer(screen, columns, wall_tops, wall_heights, wall_types, bands, wall_xs, lods)
+
+class PythonBackend(RaycastBackend):
+    # Referência: o DDA escalar original, um raio por vez. Lento, serve de base para a conformidade
+    name = 'python'
+
+    def cast(self, px, py, prot, ray_angles, grid, skip_field=None):
+        num_rays = len(ray_angles)
+        distances, wall_xs = np.empty(num_rays), np.empty(num_rays)
+        wall_types, hit_sides = np.empty(num_rays, dtype=np.int64), np.empty(num_rays, dtype=np.int8)
+        for i, angle in enumerate((prot + np.asarray(ray_angles)).tolist()):
+            distances[i], wall_types[i], hit_sides[i], wall_xs[i] = self.cast_ray(px, py, math.cos(angle), math.sin(angle), grid)
+        return distances, wall_types, hit_sides, wall_xs
+
+    def cast_ray(self, px, py, dx, dy, current_map):
+        map_x, map_y = int(px), int(py)
+        delta_dist_x = abs(1.0 / dx) if dx != 0 else 1e30
+        delta_dist_y = abs(1.0 / dy) if dy != 0 else 1e30
+        if dx < 0:
+            step_x, side_dist_x = -1, (px - map_x) * delta_dist_x
+        else:
+            step_x, side_dist_x = 1, (map_x + 1.0 - px) * delta_dist_x
+        if dy < 0:
+            step_y, side_dist_y = -1, (py - map_y) * delta_dist_y
+        else:
+            step_y, side_dist_y = 1, (map_y + 1.0 - py) * delta_dist_y
+        for _ in range(int(config.MAX_DEPTH * 2)):
+            if side_dist_x < side_dist_y:
+                side_dist_x += delta_dist_x; map_x += step_x; side = 0
+            else:
+                side_dist_y += delta_dist_y; map_y += step_y; side = 1
+            if not (0 <= map_y < len(current_map) and 0 <= map_x < len(current_map[0])) or current_map[map_y][map_x] != 0:
+                break
+        if side == 0:
+            perp_wall_dist = (map_x - px + (1 - step_x) / 2) / dx; wall_x = py + perp_wall_dist * dy
+        else:
+            perp_wall_dist = (map_y - py + (1 - step_y) / 2) / dy; wall_x = px + perp_wall_dist * dx
+        wall_x -= math.floor(wall_x)
+        wall_type = current_map[map_y][map_x] if 0 <= map_y < len(current_map) and 0 <= map_x < len(current_map[0]) else 1
+        return abs(perp_wall_dist), int(wall_type), side, wall_x
+
+class NumpyBackend(RaycastBackend):
+    # Padrão: todos os raios marchando juntos (BatchRaycaster), com o salto de espaço vazio
+    name = 'numpy'
+
+    def __init__(self):
+        self.raycaster = BatchRaycaster()
+
+    def cast(self, px, py, prot, ray_angles, grid, skip_field=None):
+        return self.raycaster.cast(px, py, prot, ray_angles, grid, skip_field)
+
+def cast_kernel(px, py, angles, grid, max_steps, distances, wall_types, hit_sides, wall_xs):
+    # DDA escalar com a mesma conta do BatchRaycaster (first + passos * delta); compilado pelo numba quando houver
+    map_h, map_w = grid.shape
+    start_x, start_y = int(px), int(py)
+    for i in range(angles.shape[0]):
+        dx, dy = math.cos(angles[i]), math.sin(angles[i])
+        delta_x = abs(1.0 / dx) if dx != 0 else 1e30
+        delta_y = abs(1.0 / dy) if dy != 0 else 1e30
+        step_x = -1 if dx < 0 else 1
+        step_y = -1 if dy < 0 else 1
+        first_x = (px - start_x) * delta_x if dx < 0 else (start_x + 1.0 - px) * delta_x
+        first_y = (py - start_y) * delta_y if dy < 0 else (start_y + 1.0 - py) * delta_y
+        map_x, map_y, steps_x, steps_y, side, cell = start_x, start_y, 0, 0, 0, 1
+        while True:
+            if first_x + steps_x * delta_x < first_y + steps_y * delta_y:
+                steps_x += 1; map_x += step_x; side = 0
+            else:
+                steps_y += 1; map_y += step_y; side = 1
+            cell = grid[map_y, map_x] if 0 <= map_x < map_w and 0 <= map_y < map_h else 1
+            if cell != 0 or steps_x + steps_y >= max_steps: break
+        if side == 0:
+            perp = (map_x - px + (1 - step_x) / 2) / (dx if dx != 0 else 1.0)
+            wall_x = py + perp * dy
+        else:
+            perp = (map_y - py + (1 - step_y) / 2) / (dy if dy != 0 else 1.0)
+            wall_x = px + perp * dx
+        distances[i] = abs(perp)
+        wall_types[i] = cell
+        hit_sides[i] = side
+        wall_xs[i] = wall_x - math.floor(wall_x)
+
+def wall_layer_kernel(frame, texels, columns, column_width, wall_tops, wall_heights, column_bases, tex_heights):
+    # Uma coluna por raio visível: mesmo mapeamento de linha para texel do FrameCompositor.draw_wall_layer
+    height = frame.shape[1]
+    for i in range(columns.shape[0]):
+        top, wall_height, tex_h = wall_tops[i], wall_heights[i], tex_heights[i]
+        start, end = np.float32(max(top, 0.0)), np.float32(min(top + wall_height, float(height)))
+        if start >= end: continue
+        scale = np.float32(tex_h / wall_height)
+        for row in range(int(math.ceil(start)), height):
+            if np.float32(row) >= end: break
+            tex_y = int((np.float32(row) - np.float32(top)) * scale)
+            if tex_y < 0: tex_y = 0
+            elif tex_y > tex_h - 1: tex_y = tex_h - 1
+            pixel = texels[column_bases[i] + tex_y]
+            for offset in range(column_width):
+                frame[columns[i] * column_width + offset, row] = pixel
+
+class NumbaBackend(RaycastBackend):
+    # Opcional: os dois laços acima compilados com numba (nogil, as faixas paralelas rodam de fato juntas)
+    name = 'numba'
+
+    def __init__(self):
+        self.cast_compiled = None
+        self.layer_compiled = None
+        self.max_steps = int(config.MAX_DEPTH * 2)
+
+    def is_available(self):
+        return numba is not None
+
+    def compile(self):
+        if self.cast_compiled is None:
+            self.cast_compiled = numba.njit(nogil=True, cache=True)(cast_kernel)
+            self.layer_compiled = numba.njit(nogil=True, cache=True)(wall_layer_kernel)
+
+    def cast(self, px, py, prot, ray_angles, grid, skip_field=None):
+        self.compile()
+        num_rays = len(ray_angles)
+        distances, wall_xs = np.empty(num_rays), np.empty(num_rays)
+        wall_types, hit_sides = np.empty(num_rays, dtype=np.int64), np.empty(num_rays, dtype=np.int8)
+        self.cast_compiled(float(px), float(py), prot + np.asarray(ray_angles, dtype=np.float64), np.asarray(grid, dtype=np.uint8),
+                           self.max_steps, distances, wall_types, hit_sides, wall_xs)
+        return distances, wall_types, hit_sides, wall_xs
+
+    def draw_wall_layer(self, compositor, screen, columns, wall_tops, wall_heights, wall_types, bands, wall_xs, lods):
+        mip_arrays = compositor.texture_manager.get_mip_arrays()
+        if mip_arrays is None or not len(columns): return
+        self.compile()
+        mip_texels, mip_lookup, mip_offsets, mip_widths, mip_heights = mip_arrays
+        texels = compositor.get_mapped_texels(screen, mip_texels)
+        tex_ids = mip_lookup[np.clip(wall_types, 0, 255)]
+        tex_w, tex_h = mip_widths[lods], mip_heights[lods]
+        tex_x = (wall_xs * tex_w).astype(np.int64) % tex_w
+        column_bases = (bands * len(mip_texels) + mip_offsets[lods] + (tex_ids * tex_w + tex_x) * tex_h).astype(np.int64)
+        self.layer_compiled(compositor.frame, texels, np.asarray(columns, dtype=np.int64), config.COLUMN_WIDTH,
+                            wall_tops.astype(np.float64), wall_heights.astype(np.float64), column_bases, tex_h.astype(np.int64))
+
+BACKENDS = {backend.name: backend for backend in (PythonBackend, NumpyBackend, NumbaBackend)}
+
+def create_backend(name):
+    # Pedido indisponível (acelerador não instalado) ou desconhecido cai para o primeiro disponível de RAYCAST_FALLBACK
+    for candidate in (name,) + tuple(config.RAYCAST_FALLBACK):
+        backend_class = BACKENDS.get(candidate)
+        if backend_class is None: continue
+        backend = backend_class()
+        if backend.is_available():
+            backend.requested = name
+            return backend
+    raise ValueError(f"Nenhum backend de raycast disponível entre '{name}' e {config.RAYCAST_FALLBACK}")
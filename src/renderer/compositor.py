@@ -0,0 +1,82 @@
+import pygame
+import numpy as np
+from src import config
+
+def map_rgb_array(surface, rgb):
+    # Converte um array (..., 3) uint8 para inteiros já no formato de pixel da superfície
+    r_shift, g_shift, b_shift, _ = surface.get_shifts()
+    r_loss, g_loss, b_loss, _ = surface.get_losses()
+    rgb = rgb.astype(np.uint32)
+    return ((rgb[..., 0] >> r_loss) << r_shift) | ((rgb[..., 1] >> g_loss) << g_shift) | ((rgb[..., 2] >> b_loss) << b_shift)
+
+class FrameCompositor:
+    def __init__(self, texture_manager, lighting):
+        self.texture_manager = texture_manager
+        self.lighting = lighting
+        self.frame = None
+        self.background = None
+        self.rows = None
+        self.pixel_format = None
+        self.texel_source = None
+        self.mapped_texels = None
+
+    def setup(self, screen):
+        width, height = screen.get_size()
+        self.frame = np.zeros((width, height), dtype=np.uint32)
+        colors = np.empty((height, 3), dtype=np.uint8)
+        colors[:height // 2] = config.CEILING_COLOR
+        colors[height // 2:] = config.FLOOR_COLOR
+        self.background = map_rgb_array(screen, colors)
+        self.rows = np.arange(height, dtype=np.float32)
+        self.pixel_format = (screen.get_bitsize(), screen.get_shifts(), screen.get_losses())
+        self.texel_source = None
+
+    def get_mapped_texels(self, screen, mip_texels):
+        # Uma cópia escurecida de todos os texels por nível de sombra, já no formato da tela
+        source = (mip_texels, self.lighting.lut_version)
+        if self.texel_source is None or self.texel_source[0] is not source[0] or self.texel_source[1] != source[1]:
+            self.mapped_texels = map_rgb_array(screen, self.lighting.shade_lut[:, mip_texels]).ravel()
+            self.texel_source = source
+        return self.mapped_texels
+
+    def begin_frame(self, screen):
+        pixel_format = (screen.get_bitsize(), screen.get_shifts(), screen.get_losses())
+        if self.frame is None or self.frame.shape != screen.get_size() or self.pixel_format != pixel_format:
+            self.setup(screen)
+        self.frame[:] = self.background
+
+    def present(self, screen):
+        pygame.surfarray.blit_array(screen, self.frame)
+
+    def draw_wall_layer(self, screen, columns, wall_tops, wall_heights, wall_types, bands, wall_xs, lods):
+        mip_arrays = self.texture_manager.get_mip_arrays()
+        if mip_arrays is None or not len(columns): return
+        mip_texels, mip_lookup, mip_offsets, mip_widths, mip_heights = mip_arrays
+        texels = self.get_mapped_texels(screen, mip_texels)
+        height = self.frame.shape[1]
+
+        # Só as linhas entre o topo mais alto e a base mais baixa podem conter parede
+        draw_start = np.maximum(wall_tops, 0)
+        draw_end = np.minimum(wall_tops + wall_heights, height)
+        band_start, band_end = int(draw_start.min()), min(int(np.ceil(draw_end.max())), height)
+        if band_start >= band_end: return
+        rows = self.rows[band_start:band_end]
+
+        tops = wall_tops.astype(np.float32)[:, None]
+        visible = (rows >= draw_start.astype(np.float32)[:, None]) & (rows < draw_end.astype(np.float32)[:, None])
+
+        tex_ids = mip_lookup[np.clip(wall_types, 0, 255)]
+        tex_w, tex_h = mip_widths[lods], mip_heights[lods]
+        tex_x = (wall_xs * tex_w).astype(np.int64) % tex_w
+        column_base = (bands * len(mip_texels) + mip_offsets[lods] + (tex_ids * tex_w + tex_x) * tex_h).astype(np.int32)[:, None]
+        tex_scale = (tex_h / wall_heights).astype(np.float32)[:, None]
+        tex_y = ((rows - tops) * tex_scale).astype(np.int32)
+        np.clip(tex_y, 0, (tex_h - 1)[:, None], out=tex_y)
+        tex_y += column_base
+
+        layer = np.take(texels, tex_y)
+        column_width = config.COLUMN_WIDTH
+        # Fora da parede mantém o que já está no frame (fundo ou chão/teto)
+        np.copyto(layer, self.frame[columns * column_width, band_start:band_end], where=~visible)
+        for offset in range(column_width):
+            self.frame[columns * column_width + offset, band_start:band_end] = layer
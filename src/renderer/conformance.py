@@ -0,0 +1,140 @@
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import numpy as np
+import pygame
+from src import config
+from src.renderer.backends import BACKENDS
+
+REFERENCE = 'python'
+# Imagens de referência versionadas (backend 'python', preset 'high'): comparação padrão da suíte e do teste
+GOLDEN_PATH = os.path.join('tests', 'data', 'conformance_high_256x144.npz')
+GOLDEN_RESOLUTION = (256, 144)
+GOLDEN_POSES = 3
+
+def fixed_poses(grid, count, seed):
+    # Poses sorteadas com seed fixa entre as células vazias: as mesmas em toda execução e em todo backend
+    rng = np.random.default_rng(seed)
+    free = np.flatnonzero(np.asarray(grid).ravel() == 0)
+    width = grid.shape[1]
+    cells = rng.choice(free, count)
+    offsets = rng.uniform(0.2, 0.8, (count, 2))
+    angles = rng.uniform(0, 2 * np.pi, count)
+    return [(float(c % width + ox), float(c // width + oy), float(a)) for c, (ox, oy), a in zip(cells, offsets, angles)]
+
+def render_pose(game, backend, pose):
+    renderer, player = game.renderer, game.player
+    # Sem queda silenciosa para RAYCAST_FALLBACK: conferir 'numba' sem numba conferiria o numpy de novo
+    if renderer.set_backend(backend).name != backend: raise ValueError(f"Backend '{backend}' indisponível nesta máquina")
+    player.x, player.y, player.rot = pose
+    player.prev_x, player.prev_y, player.prev_rot = pose
+    player.alpha = 1.0
+    renderer.render_game_world()
+    return pygame.surfarray.array3d(renderer.screen)
+
+def compare_frames(frame, reference):
+    # Fração de pixels diferentes e maior diferença de canal
+    if frame.shape != reference.shape: return 1.0, 255
+    delta = np.abs(frame.astype(np.int16) - reference.astype(np.int16))
+    return float(np.any(delta, axis=2).mean()), int(delta.max())
+
+def run_conformance(game, backends, levels=None, poses_per_level=GOLDEN_POSES, tolerance=0.002, golden=None, save_golden=None, report=print):
+    # Cada backend contra a imagem de referência (backend 'python' renderizado agora, ou um arquivo salvo) em poses fixas
+    # de cada nível. O chão fica com passo de linha 1 para o tempo de máquina não mudar a imagem.
+    game.renderer.floor_caster.pin_row_step(1)
+    stored = dict(np.load(golden)) if golden else {}
+    references, results = {}, []
+    for level in levels if levels is not None else game.maps.get_levels():
+        game.current_level = level
+        game.reset_level()
+        for index, pose in enumerate(fixed_poses(game.player.map, poses_per_level, seed=level)):
+            key = f"{level}/{index}"
+            reference = stored.get(key)
+            if reference is None: reference = render_pose(game, REFERENCE, pose)
+            references[key] = reference
+            for backend in backends:
+                fraction, max_delta = compare_frames(render_pose(game, backend, pose), reference)
+                results.append({'backend': backend, 'level': level, 'pose': index, 'diff_fraction': fraction,
+                                'max_delta': max_delta, 'passed': fraction <= tolerance})
+        for backend in backends:
+            cases = [r for r in results if r['backend'] == backend and r['level'] == level]
+            worst = max(cases, key=lambda r: r['diff_fraction'])
+            report(f"{backend:<8} nível {level}  pior pose {worst['pose']}: {worst['diff_fraction'] * 100:6.3f}% dos pixels "
+                   f"(Δ máx {worst['max_delta']:3d})  {'ok' if all(r['passed'] for r in cases) else 'FALHOU'}")
+    if save_golden:
+        np.savez_compressed(save_golden, **references)
+        report(f"Imagens de referência salvas em '{save_golden}'")
+    return results
+
+def run_worker_check(game, levels=None, poses_per_level=6, worker_counts=(1, 4), row_steps=(2, 4), report=print):
+    # Faixas paralelas não podem mudar a imagem: cada passo de linha do chão fixo, com 1 e com N workers
+    caster, workers = game.renderer.floor_caster, config.RENDER_WORKERS
+    results = []
+    for row_step in row_steps:
+        caster.pin_row_step(row_step)
+        for level in levels if levels is not None else game.maps.get_levels():
+            game.current_level = level
+            game.reset_level()
+            cases = []
+            for index, pose in enumerate(fixed_poses(game.player.map, poses_per_level, seed=level)):
+                frames = []
+                for count in worker_counts:
+                    config.RENDER_WORKERS = count
+                    frames.append(render_pose(game, config.RAYCAST_BACKEND, pose))
+                fraction, max_delta = max(compare_frames(frame, frames[0]) for frame in frames[1:])
+                cases.append({'row_step': row_step, 'level': level, 'pose': index, 'diff_fraction': fraction,
+                              'max_delta': max_delta, 'passed': fraction == 0})
+            worst = max(cases, key=lambda r: r['diff_fraction'])
+            report(f"workers {'/'.join(map(str, worker_counts))} passo {row_step} nível {level}  pior pose {worst['pose']}: "
+                   f"{worst['diff_fraction'] * 100:6.3f}% dos pixels  {'ok' if all(r['passed'] for r in cases) else 'FALHOU'}")
+            results += cases
+    config.RENDER_WORKERS = workers
+    caster.pin_row_step(None)
+    return results
+
+def available_backends(names):
+    usable = []
+    for name in names:
+        backend_class = BACKENDS.get(name)
+        if backend_class is None: raise ValueError(f"Backend desconhecido '{name}' (opções: {', '.join(BACKENDS)})")
+        if backend_class().is_available(): usable.append(name)
+        else: print(f"{name:<8} indisponível nesta máquina, ignorado")
+    return usable
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Confere cada backend do passe de paredes contra a imagem de referência')
+    parser.add_argument('--backends', nargs='*', default=list(BACKENDS))
+    parser.add_argument('--levels', type=int, nargs='*')
+    parser.add_argument('--poses', type=int, default=GOLDEN_POSES, help='poses fixas por nível')
+    parser.add_argument('--resolution', default='x'.join(map(str, GOLDEN_RESOLUTION)))
+    parser.add_argument('--tolerance', type=float, default=0.002, help='fração de pixels diferentes aceita por pose')
+    parser.add_argument('--golden', help=f"imagens de referência (padrão: {GOLDEN_PATH} na resolução dele)")
+    parser.add_argument('--live', action='store_true', help="renderiza a referência com o backend 'python' agora")
+    parser.add_argument('--save-golden', metavar='PATH', help='salva as imagens de referência (.npz)')
+    parser.add_argument('--workers', type=int, nargs='*', metavar='N',
+                        help='em vez dos backends, confere que as faixas paralelas (1 contra N workers) não mudam a imagem')
+    args = parser.parse_args(argv)
+
+    from src.game import Game
+    game = Game()
+    width, height = (int(v) for v in args.resolution.lower().split('x'))
+    game.change_resolution(width, height)
+    golden = args.golden
+    if golden is None and not args.live and (width, height) == GOLDEN_RESOLUTION and os.path.exists(GOLDEN_PATH):
+        golden = GOLDEN_PATH
+    print(f"Referência: {golden or 'backend ' + REFERENCE + ' renderizado agora'}")
+    game.set_graphics_quality('high')
+    if args.workers is not None:
+        results = run_worker_check(game, args.levels, args.poses, (1, *(args.workers or [4])))
+    else:
+        results = run_conformance(game, available_backends(args.backends), args.levels, args.poses, args.tolerance,
+                                  golden, args.save_golden)
+    game.quit_game()
+    failed = [r for r in results if not r['passed']]
+    print(f"{len(results) - len(failed)}/{len(results)} casos dentro da tolerância")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
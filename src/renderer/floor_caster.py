@@ -0,0 +1,79 @@
+import time
+import numpy as np
+from src import config
+from src.renderer.compositor import map_rgb_array
+
+class FloorCaster:
+    def __init__(self, lighting):
+        self.lighting = lighting
+        self.row_step = 1
+        # Passo fixo (conformidade, vistas sem janela): o orçamento de tempo deixa de mexer nele
+        self.fixed_row_step = None
+        self.last_cast_ms = 0.0
+        self.texel_source = None
+        self.mapped_texels = None
+
+    def get_mapped_texels(self, screen, tex_array):
+        pixel_format = (screen.get_bitsize(), screen.get_shifts(), screen.get_losses())
+        source = (id(tex_array), self.lighting.lut_version, pixel_format)
+        if source != self.texel_source:
+            shaded = self.lighting.shade_lut[:, tex_array.reshape(-1, 3)]
+            self.mapped_texels = map_rgb_array(screen, shaded).ravel()
+            self.texel_source = source
+        return self.mapped_texels
+
+    def draw(self, screen, frame, view_pose, ray_angles, distance_correction, wall_buffer, tex_array, first_ray=0):
+        start_time = time.perf_counter()
+        height = frame.shape[1]
+        tex_size = tex_array.shape[0]
+        texels = self.get_mapped_texels(screen, tex_array)
+        half = height / 2
+
+        # Acima da base da parede mais distante nenhum chão aparece; além de MAX_DEPTH fica a cor de fundo
+        far_depth = min(float(wall_buffer.max()), config.MAX_DEPTH)
+        first_row = int(half + half / far_depth)
+        # Linhas amostradas na mesma fase em todas as faixas: a imagem não depende de RENDER_WORKERS
+        first_row -= (first_row - int(half)) % self.row_step
+        if first_row >= height: return 0.0
+        rows = np.arange(first_row, height, self.row_step)
+        row_dist = height / (2 * (rows + 0.5 * self.row_step - half))
+        bands = self.lighting.get_bands(row_dist, np.zeros(len(rows), dtype=np.intp))
+
+        px, py, prot = view_pose
+        angles = prot + ray_angles
+        ray_dx = (np.cos(angles) / distance_correction)[:, None]
+        ray_dy = (np.sin(angles) / distance_correction)[:, None]
+        tex_x = ((px + row_dist * ray_dx) * tex_size).astype(np.int32) & (tex_size - 1)
+        tex_y = ((py + row_dist * ray_dy) * tex_size).astype(np.int32) & (tex_size - 1)
+        tex_x *= tex_size
+        tex_x += tex_y
+        tex_x += (bands * tex_size * tex_size).astype(np.int32)
+        layer = np.take(texels, tex_x)
+
+        depth_visible = (row_dist < wall_buffer[:, None]) & (row_dist < config.MAX_DEPTH)
+        if self.row_step > 1:
+            layer = np.repeat(layer, self.row_step, axis=1)[:, :height - first_row]
+            depth_visible = np.repeat(depth_visible, self.row_step, axis=1)[:, :height - first_row]
+
+        # Teto espelha o chão em torno do horizonte: mesma coordenada de mundo, linha H-1-y
+        column_width = config.COLUMN_WIDTH
+        first_column = first_ray * column_width
+        last_column = first_column + len(ray_angles) * column_width
+        for offset in range(column_width):
+            np.copyto(frame[first_column + offset:last_column:column_width, first_row:], layer, where=depth_visible)
+            np.copyto(frame[first_column + offset:last_column:column_width, height - 1 - first_row::-1], layer, where=depth_visible)
+        return (time.perf_counter() - start_time) * 1000
+
+    def pin_row_step(self, step):
+        # None volta ao passo adaptativo
+        self.fixed_row_step = step
+        if step: self.row_step = step
+
+    def adjust_row_step(self, elapsed_ms):
+        self.last_cast_ms = elapsed_ms
+        if self.fixed_row_step:
+            self.row_step = self.fixed_row_step
+        elif self.last_cast_ms > config.FLOOR_CAST_BUDGET_MS and self.row_step < 4:
+            self.row_step *= 2
+        elif self.last_cast_ms < config.FLOOR_CAST_BUDGET_MS / 3 and self.row_step > 1:
+            self.row_step //= 2
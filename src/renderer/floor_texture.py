@@ -0,0 +1,38 @@
+import os
+import numpy as np
+from src import config
+
+WOOD_COLOR = (139, 90, 43)
+LINE_COLOR = (87, 56, 26)
+
+def create_wood_texture(size=256, seed=0):
+    # Tábuas de madeira em (x, y, rgb): fundo, juntas de 2px a cada quarto e size*40 grãos escurecidos
+    rng = np.random.default_rng(seed)
+    texture = np.empty((size, size, 3), dtype=np.int16)
+    texture[:] = WOOD_COLOR
+    plank_width = size // 4
+    for x in range(0, size, plank_width):
+        texture[x:x + 2] = LINE_COLOR
+
+    grains = size * 40
+    xs = rng.integers(0, size, grains)
+    ys = rng.integers(0, size, grains)
+    # Grãos repetidos no mesmo pixel acumulam, como no desenho ponto a ponto
+    np.subtract.at(texture, (xs, ys), rng.integers(5, 26, (grains, 3)).astype(np.int16))
+    return np.clip(texture, 0, 255).astype(np.uint8)
+
+def load_floor_textures(seed=None, cache_dir=None):
+    seed = config.FLOOR_TEXTURE_SEED if seed is None else seed
+    cache_dir = cache_dir or config.CACHE_DIR
+    path = os.path.join(cache_dir, f"floor_wood_{seed}.npy")
+    try:
+        high = np.load(path)
+    except (OSError, ValueError):
+        high = create_wood_texture(256, seed)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            np.save(path, high)
+        except OSError:
+            pass
+    # Reduções por vizinho mais próximo, como o pygame.transform.scale fazia
+    return {'high': high, 'medium': np.ascontiguousarray(high[::2, ::2]), 'low': np.ascontiguousarray(high[::4, ::4])}
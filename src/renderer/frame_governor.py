@@ -0,0 +1,51 @@
+from collections import deque
+from src import config
+
+class FrameGovernor:
+    def __init__(self, renderer):
+        self.renderer = renderer
+        self.samples = []
+        self.frame_count = 0
+        self.decisions = deque(maxlen=200)
+
+    def get_target_ms(self):
+        return config.GOVERNOR_TARGET_MS or 1000 / (config.FPS or 60)
+
+    def get_widths(self):
+        # Larguras que dividem a imagem do mundo não deixam faixa sem parede na borda direita
+        world_width = self.renderer.get_world_size()[0]
+        widths = [w for w in config.GOVERNOR_COLUMN_WIDTHS if world_width % w == 0]
+        return widths or list(config.GOVERNOR_COLUMN_WIDTHS)
+
+    def update(self, frame_ms):
+        # frame_ms: trabalho do quadro anterior (CLOCK.get_rawtime), sem a espera do limite de FPS
+        self.frame_count += 1
+        # Quadros reaproveitados (câmera parada) não dizem nada sobre o custo de renderizar
+        if self.renderer.frame_reused: return None
+        self.samples.append(frame_ms)
+        if len(self.samples) < config.GOVERNOR_WINDOW: return None
+        average_ms = sum(self.samples) / len(self.samples)
+        self.samples.clear()
+
+        widths = self.get_widths()
+        current = config.COLUMN_WIDTH
+        index = min(range(len(widths)), key=lambda i: abs(widths[i] - current))
+        target_ms = self.get_target_ms()
+        new_width, reason = current, None
+        if average_ms > target_ms * config.GOVERNOR_UPPER and index + 1 < len(widths):
+            new_width, reason = widths[index + 1], 'acima do orçamento'
+        elif index > 0:
+            # Histerese: só refina se o custo estimado com mais raios ainda ficar bem abaixo do orçamento
+            predicted_ms = average_ms * current / widths[index - 1]
+            if predicted_ms < target_ms * config.GOVERNOR_LOWER:
+                new_width, reason = widths[index - 1], 'folga no orçamento'
+        if new_width == current: return None
+
+        decision = {'frame': self.frame_count, 'average_ms': average_ms, 'target_ms': target_ms,
+                    'from_width': current, 'to_width': new_width, 'reason': reason}
+        self.decisions.append(decision)
+        self.renderer.set_column_width(new_width)
+        return decision
+
+    def reset(self):
+        self.samples.clear()
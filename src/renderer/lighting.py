@@ -0,0 +1,39 @@
+import numpy as np
+from src import config
+
+class LightingTable:
+    def __init__(self):
+        self.distance_steps = 16
+        self.shade_lut = None
+        self.distance_bands = None
+        self.levels = 0
+        self.lut_version = 0
+        self.settings = None
+        self.refresh()
+
+    def current_settings(self):
+        return (config.SHADE_LEVELS, config.MIN_SHADE, config.FOG_DISTANCE, config.SIDE_SHADE_FACTOR, config.MAX_DEPTH)
+
+    def refresh(self):
+        settings = self.current_settings()
+        if settings == self.settings: return
+        self.settings = settings
+
+        if config.SHADE_LEVELS != self.levels:
+            # Mesma conta do BLEND_RGB_MULT, tabelada por nível de sombra
+            self.levels = config.SHADE_LEVELS
+            shade_values = (np.linspace(0.0, 1.0, self.levels) * 255).astype(np.uint32)
+            self.shade_lut = ((np.arange(256, dtype=np.uint32)[None, :] * shade_values[:, None] + 255) >> 8).astype(np.uint8)
+            self.lut_version += 1
+
+        distances = np.arange(int(np.ceil(config.MAX_DEPTH * self.distance_steps)) + 1) / self.distance_steps
+        shade = np.maximum(config.MIN_SHADE, 1.0 - (distances / config.FOG_DISTANCE))
+        shade = np.stack([shade, shade * config.SIDE_SHADE_FACTOR])
+        self.distance_bands = np.rint(shade * (self.levels - 1)).astype(np.intp)
+
+    def get_bands(self, distances, hit_sides):
+        buckets = np.minimum((distances * self.distance_steps).astype(np.intp), self.distance_bands.shape[1] - 1)
+        return self.distance_bands[hit_sides, buckets]
+
+    def shade_texels(self, texels, band):
+        return self.shade_lut[band][texels]
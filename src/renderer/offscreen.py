@@ -0,0 +1,210 @@
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+import numpy as np
+import pygame
+from src import config
+from src.maps.maps import Maps
+from src.player.player import Player
+from src.renderer.renderer import Renderer
+from src.renderer.sprites import place_level_sprites
+from src.renderer.texture_manager import TextureManager
+
+# Configuração global que os presets mexem; vale só durante cada vista e volta ao que o jogo usava
+VIEW_SETTINGS = ('GRAPHICS_QUALITY', 'DYNAMIC_RESOLUTION', 'COLUMN_WIDTH', 'FOG_DISTANCE', 'RENDER_WORKERS')
+
+class OffscreenRenderer:
+    # Vistas sem janela: o Renderer desenha numa Surface comum, sem config.DISPLAY nem o laço do Game.
+    # Tem os atributos que o Renderer lê do jogo (player, texture_manager).
+    def __init__(self, maps=None, texture_manager=None, workers=1):
+        self.maps = maps or Maps()
+        self.texture_manager = texture_manager or TextureManager()
+        self.workers = workers
+        self.texture_ids = set()
+        self.level = None
+        self.quality = None
+        self.player = Player(self.maps.get_levels()[0], self.maps)
+        self.renderer = Renderer(pygame.Surface((640, 360)), self)
+        # Chão sempre com passo de linha 1: a mesma pose dá a mesma imagem, rápida ou lenta a máquina
+        self.renderer.floor_caster.pin_row_step(1)
+
+    def use_textures(self, tex_ids):
+        # Texturas só se somam: trocar de nível não refaz os mipmaps se as dele já estão carregadas
+        tex_ids = set(tex_ids) | {1}
+        if tex_ids <= self.texture_ids: return
+        self.texture_ids |= tex_ids
+        self.texture_manager.load_textures(self.texture_ids)
+        self.texture_manager.build_mipmaps(self.texture_ids)
+        self.texture_manager.active_ids = self.texture_ids
+
+    def preload(self, levels):
+        # Grades, campos de salto, texturas e texturas do chão/sprites de uma vez (no lote, antes de criar os processos)
+        tex_ids = set()
+        for level in levels:
+            if self.maps.get_map(level) is None: raise ValueError(f"Nível {level} não encontrado")
+            tex_ids |= set(self.maps.get_texture_ids(level))
+        self.use_textures(tex_ids)
+        self.renderer.get_floor_texture()
+        self.renderer.sprite_renderer.get_mip_arrays()
+
+    def set_level(self, level):
+        if level == self.level: return
+        if self.maps.get_map(level) is None: raise ValueError(f"Nível {level} não encontrado")
+        self.player = Player(level, self.maps)
+        self.renderer.player = self.player
+        self.use_textures(self.maps.get_texture_ids(level))
+        place_level_sprites(self.renderer.sprites, self.player.map, level)
+        self.renderer.texture_column_cache.clear()
+        self.level = level
+
+    @contextmanager
+    def view_settings(self, quality):
+        saved = {name: getattr(config, name) for name in VIEW_SETTINGS}
+        config.apply_graphics_quality(quality)
+        # Sem governador fora do jogo; as faixas paralelas seguem o pedido (1 dentro do lote, já paralelo por processo)
+        config.DYNAMIC_RESOLUTION = False
+        config.RENDER_WORKERS = self.workers
+        try:
+            yield
+        finally:
+            for name, value in saved.items(): setattr(config, name, value)
+
+    def set_view(self, resolution, quality):
+        # Chamado dentro de view_settings(quality): as tabelas do Renderer são montadas com o preset da vista
+        changed = False
+        if quality != self.quality:
+            self.quality = quality
+            changed = True
+        if tuple(resolution) != self.renderer.display.get_size():
+            surface = pygame.Surface(tuple(resolution))
+            self.renderer.display = self.renderer.screen = surface
+            changed = True
+        if changed: self.renderer.setup_optimizations()
+
+    def render(self, level, x, y, rot, resolution=(640, 360), quality='high'):
+        # Imagem RGB (altura, largura, 3) uint8 da pose
+        with self.view_settings(quality):
+            self.set_level(level)
+            self.set_view(resolution, quality)
+            player = self.player
+            player.x, player.y, player.rot = player.prev_x, player.prev_y, player.prev_rot = x, y, rot
+            player.alpha = 1.0
+            self.renderer.render_game_world()
+            return np.ascontiguousarray(pygame.surfarray.pixels3d(self.renderer.display).transpose(1, 0, 2))
+
+    def close(self):
+        self.renderer.strip_pool.shutdown()
+        self.maps.shutdown()
+
+# Renderizador do processo: no 'fork' vem pronto do pai (memória compartilhada por cópia na escrita)
+_worker = None
+
+def _init_worker(levels, resolution, quality):
+    global _worker
+    if _worker is None:
+        _worker = OffscreenRenderer()
+        _worker.preload(levels)
+    with _worker.view_settings(quality):
+        _worker.set_view(resolution, quality)
+
+def _render_chunk(index, pose_ids, poses, output_dir, resolution, quality):
+    start = time.perf_counter()
+    images = np.stack([_worker.render(int(level), x, y, rot, resolution, quality) for level, x, y, rot in poses.tolist()])
+    path = os.path.join(output_dir, f"views_{index:05d}.npz")
+    np.savez(path, images=images, pose_ids=pose_ids, poses=poses)
+    return index, path, len(poses), (time.perf_counter() - start) * 1000
+
+def render_batch(poses, output_dir, resolution=(640, 360), quality='high', processes=None, chunk_size=64, report=print):
+    # poses: (nível, x, y, rot) por linha. Cada bloco vira views_NNNNN.npz (images, pose_ids, poses) gravado pelo próprio
+    # worker; manifest.jsonl cresce à medida que os blocos terminam. processes=0 roda tudo neste processo.
+    global _worker
+    poses = np.asarray(poses, dtype=np.float64).reshape(-1, 4)
+    if not len(poses): raise ValueError("Nenhuma pose para renderizar")
+    # Blocos de um nível só: o worker troca de nível no máximo uma vez por bloco
+    order = np.argsort(poses[:, 0], kind='stable')
+    chunks = []
+    for level in np.unique(poses[:, 0]):
+        ids = order[poses[order, 0] == level]
+        chunks += [ids[start:start + chunk_size] for start in range(0, len(ids), chunk_size)]
+    levels = [int(level) for level in np.unique(poses[:, 0])]
+
+    os.makedirs(output_dir, exist_ok=True)
+    _worker = OffscreenRenderer()
+    _worker.preload(levels)
+    # Um quadro de aquecimento monta os caches preguiçosos (texels no formato da superfície, LUT) antes do fork
+    level, x, y, rot = poses[0].tolist()
+    _worker.render(int(level), x, y, rot, resolution, quality)
+    manifest_path = os.path.join(output_dir, 'manifest.jsonl')
+    start, done = time.perf_counter(), 0
+    with open(manifest_path, 'w') as manifest:
+        def record(index, path, count, chunk_ms):
+            nonlocal done
+            done += count
+            manifest.write(json.dumps({'file': os.path.basename(path), 'chunk': index, 'views': count}) + '\n')
+            manifest.flush()
+            report(f"bloco {index:5d}: {count} vistas em {chunk_ms:7.1f} ms  ({done}/{len(poses)})")
+
+        if processes == 0:
+            for index, ids in enumerate(chunks):
+                record(*_render_chunk(index, ids, poses[ids], output_dir, resolution, quality))
+        else:
+            # 'fork' (Linux) herda mapas e texturas já carregados; nos outros métodos cada worker carrega uma vez
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('fork') if 'fork' in methods else None
+            with ProcessPoolExecutor(processes, mp_context=context, initializer=_init_worker,
+                                     initargs=(levels, resolution, quality)) as pool:
+                futures = [pool.submit(_render_chunk, index, ids, poses[ids], output_dir, resolution, quality)
+                           for index, ids in enumerate(chunks)]
+                for future in as_completed(futures):
+                    record(*future.result())
+    _worker.close()
+    _worker = None
+    elapsed = time.perf_counter() - start
+    report(f"{len(poses)} vistas em {elapsed:.1f} s ({len(poses) / max(elapsed, 1e-9):.1f} vistas/s) em '{output_dir}'")
+    return manifest_path
+
+def random_poses(maps, levels, count, seed=0):
+    # Poses em células vazias sorteadas, repartidas entre os níveis
+    rng = np.random.default_rng(seed)
+    poses = []
+    for i, level in enumerate(levels):
+        grid = maps.get_map(level)
+        free = np.flatnonzero(grid.ravel() == 0)
+        n = count // len(levels) + (i < count % len(levels))
+        cells = rng.choice(free, n)
+        width = grid.shape[1]
+        poses.append(np.column_stack((np.full(n, level), cells % width + rng.uniform(0.2, 0.8, n),
+                                      cells // width + rng.uniform(0.2, 0.8, n), rng.uniform(0, 2 * np.pi, n))))
+    return np.concatenate(poses)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Renderiza vistas em lote sem janela')
+    parser.add_argument('output_dir')
+    parser.add_argument('--poses', help='arquivo CSV com nível,x,y,rot por linha')
+    parser.add_argument('--random', type=int, metavar='N', help='N poses sorteadas nos níveis de --levels')
+    parser.add_argument('--levels', type=int, nargs='*')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--resolution', default='640x360')
+    parser.add_argument('--quality', default='high', choices=list(config.QUALITY_PRESETS))
+    parser.add_argument('--processes', type=int, help='processos do lote (padrão: um por núcleo; 0 = sem pool)')
+    parser.add_argument('--chunk', type=int, default=64, help='vistas por arquivo .npz')
+    args = parser.parse_args(argv)
+
+    if args.poses:
+        poses = np.loadtxt(args.poses, delimiter=',', ndmin=2)
+    elif args.random:
+        maps = Maps()
+        poses = random_poses(maps, args.levels or maps.get_levels(), args.random, args.seed)
+        maps.shutdown()
+    else:
+        parser.error('informe --poses ou --random')
+    resolution = tuple(int(v) for v in args.resolution.lower().split('x'))
+    render_batch(poses, args.output_dir, resolution, args.quality, args.processes, args.chunk)
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -2,106 +2,233 @@ import pygame
 import numpy as np
 import math
 from src import config
-import random
+from src.renderer.raycaster import BatchRaycaster
+from src.renderer.backends import create_backend
+from src.renderer.compositor import FrameCompositor
+from src.renderer.lighting import LightingTable
+from src.renderer.floor_caster import FloorCaster
+from src.renderer.floor_texture import load_floor_textures
+from src.renderer.strip_pool import StripPool
+from src.renderer.view_cache import ViewCache
+from src.renderer.sprites import SpritePool, SpriteRenderer
+from src.profiler.profiler import profiler
 
 class Renderer:
     def __init__(self, screen, game):
+        # display: superfície final. screen: alvo do passe do mundo, a própria display ou uma menor (RENDER_SCALE)
+        self.display = screen
         self.screen = screen
+        self.target_key = None
         self.game = game
         self.player = game.player
         self.texture_manager = game.texture_manager
+        self.raycaster = BatchRaycaster()
+        self.backend = create_backend(config.RAYCAST_BACKEND)
+        self.lighting = LightingTable()
+        self.compositor = FrameCompositor(self.texture_manager, self.lighting)
+        self.floor_caster = FloorCaster(self.lighting)
+        self.strip_pool = StripPool()
+        self.view_cache = ViewCache()
+        self.sprites = SpritePool()
+        self.sprite_renderer = SpriteRenderer(self.lighting)
         
         self.ray_angles = np.array([])
         self.distance_correction = np.array([])
         self.wall_buffer = np.array([])
         self.texture_column_cache = {}
-        self.max_column_cache = 200
+        self.max_column_cache = 4096
+        self.ray_tables = {}
+        self.frame_reused = False
+        self.view_pose = None
 
-        self.floor_texture_high_res = self.create_procedural_wood_texture(size=(256, 256))
-        
-        self.floor_texture_med_res = pygame.transform.scale(self.floor_texture_high_res, (128, 128))
-        self.floor_texture_low_res = pygame.transform.scale(self.floor_texture_high_res, (64, 64))
-
-        self.tex_arrays = {
-            'high': pygame.surfarray.array3d(self.floor_texture_high_res),
-            'medium': pygame.surfarray.array3d(self.floor_texture_med_res),
-            'low': pygame.surfarray.array3d(self.floor_texture_low_res)
-        }
-        self.tex_sizes = {
-            'high': 256, 'medium': 128, 'low': 64
-        }
+        # Texturas do chão só são geradas (ou lidas do cache em disco) no primeiro quadro com chão
+        self.tex_arrays = None
+        if not config.LAZY_STARTUP: self.get_floor_texture()
 
         self.setup_optimizations()
 
-    def create_procedural_wood_texture(self, size=(256, 256)):
-        wood_color = (139, 90, 43); line_color = (87, 56, 26)
-        plank_width = size[0] // 4 
-        texture = pygame.Surface(size)
-        texture.fill(wood_color)
-        for x in range(0, size[0], plank_width):
-            pygame.draw.line(texture, line_color, (x, 0), (x, size[1]), 2)
-        for _ in range(int(size[0] * 40)): 
-            x = random.randint(0, size[0] - 1); y = random.randint(0, size[1] - 1)
-            r, g, b, _ = texture.get_at((x, y))
-            grain_color = (max(0,r-random.randint(5,25)), max(0,g-random.randint(5,25)), max(0,b-random.randint(5,25)))
-            texture.set_at((x, y), grain_color)
-        return texture
+    def get_floor_texture(self):
+        if self.tex_arrays is None:
+            self.tex_arrays = load_floor_textures()
+        return self.tex_arrays.get(config.GRAPHICS_QUALITY, self.tex_arrays['medium'])
 
     def setup_optimizations(self):
         self.texture_column_cache.clear()
-        num_rays = config.WIN_WIDTH // config.COLUMN_WIDTH
+        self.view_cache.clear()
+        self.setup_render_target()
+        self.apply_ray_table()
+        self.lighting.refresh()
+
+    def setup_render_target(self):
+        # Com RENDER_SCALE < 1 o mundo é desenhado numa superfície menor no formato da tela e ampliado uma vez.
+        # Largura múltipla de 8 para as larguras de coluna do governador continuarem dividindo a imagem
+        width, height = self.display.get_size()
+        scale = config.RENDER_SCALE
+        if scale >= 1:
+            self.screen = self.display
+        else:
+            size = (max(8, int(width * scale) // 8 * 8), max(1, int(height * scale)))
+            if self.screen is self.display or self.screen.get_size() != size:
+                self.screen = pygame.Surface(size, 0, self.display)
+        self.target_key = (self.display.get_size(), scale)
+
+    def get_world_size(self):
+        return self.screen.get_size()
+
+    def apply_ray_table(self):
+        # Tabelas por (largura da imagem do mundo, largura de coluna, FOV): o governador troca de largura sem recalcular
+        num_rays = self.screen.get_width() // config.COLUMN_WIDTH
         if num_rays == 0: num_rays = 1
-        self.ray_angles = np.array([math.radians(i*config.FOV/num_rays - config.FOV/2) for i in range(num_rays)])
-        self.distance_correction = np.cos(self.ray_angles)
-        self.wall_buffer = np.full(num_rays, float('inf'))
+        key = (num_rays, config.FOV)
+        table = self.ray_tables.get(key)
+        if table is None:
+            ray_angles = np.array([math.radians(i*config.FOV/num_rays - config.FOV/2) for i in range(num_rays)])
+            table = self.ray_tables[key] = (ray_angles, np.cos(ray_angles), np.full(num_rays, float('inf')))
+        self.ray_angles, self.distance_correction, self.wall_buffer = table
+
+    def set_backend(self, name):
+        config.RAYCAST_BACKEND = name
+        self.backend = create_backend(name)
+        # Raios e quadros guardados vieram de outra implementação
+        self.view_cache.clear()
+        return self.backend
+
+    def set_column_width(self, column_width):
+        config.COLUMN_WIDTH = column_width
+        self.apply_ray_table()
         
+    def get_view_key(self):
+        mip_arrays = self.texture_manager.get_mip_arrays()
+        return (*self.view_pose, self.player.map_version, self.sprites.version, config.GRAPHICS_QUALITY, config.COLUMN_WIDTH,
+                config.FLOOR_CASTING, self.screen.get_size(), self.lighting.lut_version,
+                None if mip_arrays is None else id(mip_arrays[0]))
+
     def render_game_world(self):
-        pygame.draw.rect(self.screen, config.CEILING_COLOR, (0, 0, config.WIN_WIDTH, config.WIN_HEIGHT // 2))
-        pygame.draw.rect(self.screen, config.FLOOR_COLOR, (0, config.WIN_HEIGHT // 2, config.WIN_WIDTH, config.WIN_HEIGHT // 2))
-        self.draw_walls()
+        # Pose interpolada entre ticks da simulação, fixada para o quadro todo (faixas paralelas leem a mesma)
+        self.view_pose = self.player.get_view_pose()
+        if self.target_key != (self.display.get_size(), config.RENDER_SCALE):
+            self.setup_render_target()
+            self.apply_ray_table()
+        if self.backend.requested != config.RAYCAST_BACKEND: self.set_backend(config.RAYCAST_BACKEND)
+        if config.WALL_RENDER_MODE == 'buffer':
+            self.lighting.refresh()
+            self.frame_reused = config.FRAME_REUSE and self.view_cache.reuse_frame(self.get_view_key())
+            if not self.frame_reused:
+                self.compositor.begin_frame(self.screen)
+                with profiler.span('draw_walls'):
+                    self.draw_walls()
+            self.compositor.present(self.screen)
+            self.present_world()
+            return
+        width, height = self.screen.get_size()
+        pygame.draw.rect(self.screen, config.CEILING_COLOR, (0, 0, width, height // 2))
+        pygame.draw.rect(self.screen, config.FLOOR_COLOR, (0, height // 2, width, height // 2))
+        with profiler.span('draw_walls'):
+            self.draw_walls()
+        self.present_world()
+
+    def present_world(self):
+        # Única cópia ampliada do mundo para a tela; o HUD é desenhado depois, já na resolução nativa
+        if self.screen is self.display: return
+        with profiler.span('upscale'):
+            if config.RENDER_SCALE_SMOOTH and self.display.get_bitsize() >= 24:
+                pygame.transform.smoothscale(self.screen, self.display.get_size(), self.display)
+            else:
+                pygame.transform.scale(self.screen, self.display.get_size(), self.display)
 
     def draw_walls(self):
         self.wall_buffer.fill(float('inf'))
-        px, py, prot = self.player.x, self.player.y, self.player.rot
-        for i, angle in enumerate(self.ray_angles):
-            ray_angle = prot + angle
-            dx, dy = math.cos(ray_angle), math.sin(ray_angle)
-            distance, wall_type, hit_side, wall_x = self.improved_dda_with_texture(px, py, dx, dy, self.player.map)
-            if 0 < distance < config.MAX_DEPTH:
-                corrected_distance = distance * self.distance_correction[i]
-                wall_height = config.WIN_HEIGHT / max(corrected_distance, 0.0001)
-                
-                if config.GRAPHICS_QUALITY == 'high':
-                    if corrected_distance < 4:
-                        tex_quality = 'high'
-                    elif corrected_distance < 8:
-                        tex_quality = 'medium'
-                    else:
-                        tex_quality = 'low'
-                else: 
-                    tex_quality = 'medium'
-
-                wall_top = (config.WIN_HEIGHT / 2) - (wall_height / 2)
-                base_shade = max(config.MIN_SHADE, 1.0 - (corrected_distance / config.FOG_DISTANCE))
-                if hit_side == 1: base_shade *= config.SIDE_SHADE_FACTOR
-                self.draw_fast_textured_column(i * config.COLUMN_WIDTH, wall_top, wall_height, wall_type, base_shade, wall_x, tex_quality)
-
-    def draw_fast_textured_column(self, screen_x, wall_top, wall_height, wall_type, shade, wall_x, tex_quality):
-        base_texture = self.texture_manager.get_wall_texture(wall_type)
-        if not base_texture: return
-
-        if tex_quality == 'high':
-            texture = base_texture 
-        else: 
-            tex_size = self.tex_sizes[tex_quality]
-            texture = pygame.transform.scale(base_texture, (tex_size, tex_size))
-
-        tex_height = texture.get_height()
-        tex_x = int(wall_x * texture.get_width()) % texture.get_width()
-        tex_column = texture.subsurface(tex_x, 0, 1, tex_height)
+        self.lighting.refresh()
+        grid = self.raycaster.to_grid(self.player.map)
+
+        if config.WALL_RENDER_MODE == 'buffer':
+            workers = self.strip_pool.get_worker_count()
+            if workers > 1:
+                self.prepare_strip_rendering()
+                floor_times = self.strip_pool.run(self.draw_wall_strip, len(self.ray_angles), workers, grid)
+                self.floor_caster.adjust_row_step(sum(floor_times) / workers)
+            else:
+                self.floor_caster.adjust_row_step(self.draw_wall_strip(0, len(self.ray_angles), grid))
+            # Sprites depois de todas as faixas: precisam do wall_buffer completo para o recorte por coluna
+            if config.SPRITES_ENABLED:
+                self.sprite_renderer.draw(self.screen, self.compositor.frame, self.view_pose, self.ray_angles, self.wall_buffer, self.sprites)
+            return
+
+        visible, wall_tops, wall_heights, wall_types, bands, wall_xs, lods = self.cast_wall_columns(0, len(self.ray_angles), grid)
+        columns = zip(visible.tolist(), wall_tops.tolist(), wall_heights.tolist(),
+                      wall_types.tolist(), bands.tolist(), wall_xs.tolist(), lods.tolist())
+        for i, wall_top, wall_height, wall_type, band, wall_x, lod in columns:
+            self.draw_fast_textured_column(i * config.COLUMN_WIDTH, wall_top, wall_height, wall_type, band, wall_x, lod)
+        if config.SPRITES_ENABLED and self.sprites.count:
+            # Aqui as paredes vão direto para a tela: os sprites usam o mesmo escritor de colunas numa cópia contígua
+            frame = pygame.surfarray.array2d(self.screen)
+            self.sprite_renderer.draw(self.screen, frame, self.view_pose, self.ray_angles, self.wall_buffer, self.sprites)
+            pygame.surfarray.blit_array(self.screen, frame)
+
+    def cast_wall_columns(self, start, end, grid):
+        px, py, prot = self.view_pose
+        ray_key = (px, py, prot, self.player.map_version, len(self.ray_angles), start, end)
+        rays = self.view_cache.get_rays(ray_key)
+        if rays is None:
+            skip_field = self.player.level_grid.skip_field if config.EMPTY_SPACE_SKIPPING else None
+            rays = self.backend.cast(px, py, prot, self.ray_angles[start:end], grid, skip_field)
+            self.view_cache.store_rays(ray_key, rays)
+        distances, wall_types, hit_sides, wall_xs = rays
+
+        visible = np.nonzero((distances > 0) & (distances < config.MAX_DEPTH))[0]
+        corrected = distances[visible] * self.distance_correction[start:end][visible]
+        height = self.screen.get_height()
+        wall_heights = height / np.maximum(corrected, 0.0001)
+        wall_tops = (height / 2) - (wall_heights / 2)
+        bands = self.lighting.get_bands(corrected, hit_sides[visible])
+        lods = self.texture_manager.select_lod(wall_heights)
+        visible += start
+        self.wall_buffer[visible] = corrected
+        return visible, wall_tops, wall_heights, wall_types[visible - start], bands, wall_xs[visible - start], lods
+
+    def draw_wall_strip(self, start, end, grid):
+        # Raios [start, end) escrevem só nas suas colunas do frame, então faixas podem rodar em paralelo
+        visible, wall_tops, wall_heights, wall_types, bands, wall_xs, lods = self.cast_wall_columns(start, end, grid)
+        floor_ms = 0.0
+        if config.FLOOR_CASTING:
+            tex_array = self.get_floor_texture()
+            floor_ms = self.floor_caster.draw(self.screen, self.compositor.frame, self.view_pose, self.ray_angles[start:end],
+                                              self.distance_correction[start:end], self.wall_buffer[start:end], tex_array, first_ray=start)
+        self.backend.draw_wall_layer(self.compositor, self.screen, visible, wall_tops, wall_heights, wall_types, bands, wall_xs, lods)
+        return floor_ms
+
+    def prepare_strip_rendering(self):
+        # Caches preguiçosos são montados aqui, antes de as threads começarem
+        mip_arrays = self.texture_manager.get_mip_arrays()
+        if mip_arrays is not None:
+            self.compositor.get_mapped_texels(self.screen, mip_arrays[0])
+        if config.FLOOR_CASTING:
+            self.floor_caster.get_mapped_texels(self.screen, self.get_floor_texture())
+
+    def get_texture_column(self, wall_type, lod, wall_x, band):
+        levels = self.texture_manager.mipmaps.get(wall_type, self.texture_manager.mipmaps.get(1))
+        if not levels: return None
+        lod = min(lod, len(levels) - 1)
+        tex_w = levels[lod].shape[0]
+        tex_x = int(wall_x * tex_w) % tex_w
+        cache_key = (wall_type, lod, tex_x, band, self.lighting.lut_version)
+        tex_column = self.texture_column_cache.get(cache_key)
+        if tex_column is None:
+            texels = self.texture_manager.get_texel_column(wall_type, lod, tex_x)
+            if texels is None: return None
+            tex_column = pygame.surfarray.make_surface(self.lighting.shade_texels(texels, band)[None])
+            if len(self.texture_column_cache) < self.max_column_cache:
+                self.texture_column_cache[cache_key] = tex_column
+        return tex_column
+
+    def draw_fast_textured_column(self, screen_x, wall_top, wall_height, wall_type, band, wall_x, lod):
+        tex_column = self.get_texture_column(wall_type, lod, wall_x, band)
+        if not tex_column: return
+
+        tex_height = tex_column.get_height()
 
         draw_start = max(wall_top, 0)
-        draw_end = min(wall_top + wall_height, config.WIN_HEIGHT)
+        draw_end = min(wall_top + wall_height, self.screen.get_height())
         if draw_start >= draw_end: return
         
         onscreen_height = draw_end - draw_start
@@ -118,43 +245,9 @@ class Renderer:
             else:
                 return
 
-            if shade < 1.0:
-                scaled_slice = self.apply_shade_fast(scaled_slice, shade)
-                
             self.screen.blit(scaled_slice, (screen_x, draw_start))
         except (ValueError, pygame.error):
             pass
             
     def improved_dda_with_texture(self, px, py, dx, dy, current_map):
-        map_x, map_y = int(px), int(py)
-        delta_dist_x = abs(1.0 / dx) if dx != 0 else 1e30
-        delta_dist_y = abs(1.0 / dy) if dy != 0 else 1e30
-        if dx < 0:
-            step_x, side_dist_x = -1, (px - map_x) * delta_dist_x
-        else:
-            step_x, side_dist_x = 1, (map_x + 1.0 - px) * delta_dist_x
-        if dy < 0:
-            step_y, side_dist_y = -1, (py - map_y) * delta_dist_y
-        else:
-            step_y, side_dist_y = 1, (map_y + 1.0 - py) * delta_dist_y
-        for _ in range(int(config.MAX_DEPTH * 2)):
-            if side_dist_x < side_dist_y:
-                side_dist_x += delta_dist_x; map_x += step_x; side = 0
-            else:
-                side_dist_y += delta_dist_y; map_y += step_y; side = 1
-            if not (0 <= map_y < len(current_map) and 0 <= map_x < len(current_map[0])) or current_map[map_y][map_x] != 0:
-                break
-        if side == 0:
-            perp_wall_dist = (map_x - px + (1 - step_x) / 2) / dx; wall_x = py + perp_wall_dist * dy
-        else:
-            perp_wall_dist = (map_y - py + (1 - step_y) / 2) / dy; wall_x = px + perp_wall_dist * dx
-        wall_x -= math.floor(wall_x)
-        wall_type = current_map[map_y][map_x] if 0 <= map_y < len(current_map) and 0 <= map_x < len(current_map[0]) else 1
-        return abs(perp_wall_dist), wall_type, side, wall_x
-
-    def apply_shade_fast(self, surface, shade):
-        shade_value = int(255 * shade)
-        shade_color = (shade_value, shade_value, shade_value)
-        surface.fill(shade_color, special_flags=pygame.BLEND_RGB_MULT)
-        return surface
-
+        return self.backend.cast_ray(px, py, dx, dy, current_map)
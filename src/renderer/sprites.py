@@ -0,0 +1,258 @@
+import math
+import numpy as np
+import pygame
+from src import config
+from src.renderer.compositor import map_rgb_array
+
+SPRITE_ITEM, SPRITE_EXIT, SPRITE_PLANT = 0, 1, 2
+SPRITE_TEXTURE_SIZE = 64
+NEAR_PLANE = 0.05
+
+def create_sprite_textures(size=SPRITE_TEXTURE_SIZE):
+    # Sprites desenhados na hora (não há arte para eles em assets/): moeda, marcador de saída e planta.
+    # Retorna (tipo, x, y, 4) uint8 com alfa, no mesmo layout (x, y) das texturas de parede.
+    surfaces = []
+    center = size // 2
+
+    item = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(item, (150, 110, 20), (center, size - size // 4), size // 5)
+    pygame.draw.circle(item, (240, 200, 60), (center, size - size // 4), size // 5 - size // 16)
+    pygame.draw.circle(item, (255, 240, 150), (center - size // 16, size - size // 4 - size // 16), size // 16)
+    surfaces.append(item)
+
+    marker = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.rect(marker, (60, 60, 60), (center - size // 32 - 1, size // 3, size // 16 + 2, size - size // 3))
+    arrow = [(center, size // 16), (size - size // 8, size // 3), (center + size // 8, size // 3),
+             (center + size // 8, size // 2), (center - size // 8, size // 2), (center - size // 8, size // 3), (size // 8, size // 3)]
+    pygame.draw.polygon(marker, (40, 200, 80), arrow)
+    pygame.draw.polygon(marker, (20, 110, 40), arrow, max(1, size // 32))
+    surfaces.append(marker)
+
+    plant = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.polygon(plant, (130, 70, 40), [(center - size // 6, size - size // 4), (center + size // 6, size - size // 4),
+                                               (center + size // 8, size - 1), (center - size // 8, size - 1)])
+    for angle in (-60, -30, 0, 30, 60):
+        tip = (center + int(math.sin(math.radians(angle)) * size * 0.4), size - size // 4 - int(math.cos(math.radians(angle)) * size * 0.55))
+        pygame.draw.line(plant, (40, 140, 50), (center, size - size // 4), tip, max(2, size // 12))
+    surfaces.append(plant)
+
+    return np.stack([np.dstack((pygame.surfarray.pixels3d(s).copy(), pygame.surfarray.pixels_alpha(s).copy())) for s in surfaces])
+
+def build_sprite_mipmaps(rgba):
+    # Mesmo bloco único (nível, tipo, x, y) dos mipmaps de parede, com a cor pré-multiplicada pelo alfa
+    # para a borda transparente não vazar para a cor nos níveis menores; o texel fica opaco com alfa >= 0.5
+    level = rgba.astype(np.float32)
+    level[..., :3] *= level[..., 3:] / 255
+    texels, opaque = [], []
+    while True:
+        alpha = level[..., 3:]
+        color = np.where(alpha > 0, level[..., :3] * 255 / np.maximum(alpha, 1e-6), 0)
+        texels.append(color.round().astype(np.uint8).reshape(-1, 3))
+        opaque.append((alpha[..., 0] >= 127.5).ravel())
+        _, w, h, _ = level.shape
+        if w == 1 or h == 1: break
+        level = level[:, :w - w % 2, :h - h % 2]
+        level = (level[:, 0::2, 0::2] + level[:, 1::2, 0::2] + level[:, 0::2, 1::2] + level[:, 1::2, 1::2]) / 4
+    sizes = [len(t) for t in texels]
+    offsets = np.zeros(len(sizes), dtype=np.int64)
+    offsets[1:] = np.cumsum(sizes[:-1])
+    widths = np.array([rgba.shape[1] >> lod for lod in range(len(sizes))], dtype=np.int32)
+    heights = np.array([rgba.shape[2] >> lod for lod in range(len(sizes))], dtype=np.int32)
+    return np.concatenate(texels), np.concatenate(opaque), offsets, widths, heights
+
+class SpritePool:
+    # Estrutura de arrays: um sprite é uma posição nos arrays, não um objeto. Remover troca com o último,
+    # então os ativos ficam sempre em [0, count) e a projeção é uma fatia só.
+    def __init__(self, capacity=256):
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.kind = np.zeros(capacity, dtype=np.int32)
+        self.scale = np.ones(capacity)
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.slots = {}
+        self.count = 0
+        self.next_id = 0
+        # Muda a cada alteração; entra na chave de reaproveitamento de frame do renderer
+        self.version = 0
+
+    def grow(self, capacity):
+        for name in ('x', 'y', 'kind', 'scale', 'ids'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def add(self, x, y, kind, scale=1.0):
+        return self.add_many([x], [y], [kind], [scale])[0]
+
+    def add_many(self, xs, ys, kinds, scales=None):
+        n = len(xs)
+        if self.count + n > len(self.x): self.grow(max(2 * len(self.x), self.count + n))
+        start, end = self.count, self.count + n
+        self.x[start:end], self.y[start:end], self.kind[start:end] = xs, ys, kinds
+        self.scale[start:end] = 1.0 if scales is None else scales
+        ids = np.arange(self.next_id, self.next_id + n)
+        self.ids[start:end] = ids
+        self.slots.update(zip(ids.tolist(), range(start, end)))
+        self.next_id += n
+        self.count = end
+        self.version += 1
+        return ids.tolist()
+
+    def remove(self, sprite_id):
+        slot = self.slots.pop(sprite_id, None)
+        if slot is None: return False
+        last = self.count - 1
+        if slot != last:
+            for array in (self.x, self.y, self.kind, self.scale, self.ids):
+                array[slot] = array[last]
+            self.slots[int(self.ids[slot])] = slot
+        self.count = last
+        self.version += 1
+        return True
+
+    def move(self, sprite_id, x, y):
+        slot = self.slots[sprite_id]
+        self.x[slot], self.y[slot] = x, y
+        self.version += 1
+
+    def clear(self):
+        self.slots.clear()
+        self.count = 0
+        self.version += 1
+
+def place_level_sprites(pool, grid, seed=0):
+    # Marcador em frente a cada saída e itens/plantas decorativos em células vazias sorteadas (fixas por seed)
+    pool.clear()
+    height, width = grid.shape
+    empty = grid == 0
+    exits_y, exits_x = np.nonzero(grid == 9)
+    for x, y in zip(exits_x.tolist(), exits_y.tolist()):
+        for nx, ny in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)):
+            if 0 <= nx < width and 0 <= ny < height and empty[ny, nx]:
+                # Encostado no lado da saída, para não tapar o corredor
+                pool.add(nx + 0.5 + (x - nx) * 0.3, ny + 0.5 + (y - ny) * 0.3, SPRITE_EXIT, 0.6)
+                break
+    cells = np.flatnonzero(empty.ravel())
+    rng = np.random.default_rng(seed)
+    count = min(int(len(cells) * config.SPRITE_DENSITY), config.MAX_LEVEL_SPRITES)
+    if count <= 0: return
+    chosen = rng.choice(cells, count, replace=False)
+    kinds = rng.choice(np.array([SPRITE_ITEM, SPRITE_PLANT], dtype=np.int32), count)
+    scales = np.where(kinds == SPRITE_ITEM, 0.5, 0.8)
+    pool.add_many(chosen % width + 0.5, chosen // width + 0.5, kinds, scales)
+
+class SpriteRenderer:
+    def __init__(self, lighting):
+        self.lighting = lighting
+        self.mip_arrays = None
+        self.texel_source = None
+        self.mapped_texels = None
+        self.shaded_opaque = None
+        self.last_drawn = 0
+
+    def get_mip_arrays(self):
+        if self.mip_arrays is None:
+            self.mip_arrays = build_sprite_mipmaps(create_sprite_textures())
+        return self.mip_arrays
+
+    def get_mapped_texels(self, screen, texels):
+        pixel_format = (screen.get_bitsize(), screen.get_shifts(), screen.get_losses())
+        source = (self.lighting.lut_version, pixel_format)
+        if source != self.texel_source:
+            self.mapped_texels = map_rgb_array(screen, self.lighting.shade_lut[:, texels]).ravel()
+            self.texel_source = source
+        return self.mapped_texels
+
+    def get_shaded_opaque(self, opaque):
+        levels = self.lighting.levels
+        if self.shaded_opaque is None or len(self.shaded_opaque) != levels * len(opaque):
+            self.shaded_opaque = np.tile(opaque, levels)
+        return self.shaded_opaque
+
+    def draw(self, screen, frame, view_pose, ray_angles, wall_buffer, pool):
+        # Projeta todos os sprites de uma vez, recorta por coluna contra wall_buffer e desenha como as paredes
+        self.last_drawn = 0
+        n = pool.count
+        if n == 0 or len(ray_angles) == 0: return
+        texels, opaque, mip_offsets, mip_widths, mip_heights = self.get_mip_arrays()
+        mapped = self.get_mapped_texels(screen, texels)
+        px, py, prot = view_pose
+
+        rel_x, rel_y = pool.x[:n] - px, pool.y[:n] - py
+        cos_r, sin_r = math.cos(prot), math.sin(prot)
+        depth = rel_x * cos_r + rel_y * sin_r
+        lateral = rel_y * cos_r - rel_x * sin_r
+        half = pool.scale[:n] / 2
+        first_angle, angle_step = ray_angles[0], math.radians(config.FOV) / len(ray_angles)
+        # Raio i cobre o sprite se o ângulo dele cai entre as bordas esquerda e direita
+        with np.errstate(divide='ignore', invalid='ignore'):
+            col_start = np.ceil((np.arctan2(lateral - half, depth) - first_angle) / angle_step)
+            col_end = np.ceil((np.arctan2(lateral + half, depth) - first_angle) / angle_step)
+        col_start = np.clip(col_start, 0, len(ray_angles)).astype(np.int64)
+        col_end = np.clip(col_end, 0, len(ray_angles)).astype(np.int64)
+        visible = np.flatnonzero((depth > NEAR_PLANE) & (depth < config.MAX_DEPTH) & (col_end > col_start))
+        if not visible.size: return
+        # Pares (sprite, coluna) e recorte pela parede mais próxima daquela coluna
+        spans = col_end[visible] - col_start[visible]
+        pair_sprite = np.repeat(visible, spans)
+        pair_column = np.arange(len(pair_sprite)) - np.repeat(np.cumsum(spans) - spans, spans) + col_start[pair_sprite]
+        in_front = depth[pair_sprite] < wall_buffer[pair_column]
+        pair_sprite, pair_column = pair_sprite[in_front], pair_column[in_front]
+        if not pair_sprite.size: return
+
+        # Camadas: em cada coluna o sprite mais distante é a camada 0 do desenho, o seguinte a 1...
+        # Dentro de uma camada nenhuma coluna se repete, então cada escrita em lote tem índices únicos
+        pair_depth = depth[pair_sprite]
+        order = np.lexsort((-pair_depth, pair_column))
+        sorted_columns = pair_column[order]
+        group_start = np.flatnonzero(np.r_[True, sorted_columns[1:] != sorted_columns[:-1]])
+        ranks = np.arange(len(order)) - np.repeat(group_start, np.diff(np.r_[group_start, len(order)]))
+        order = order[np.argsort(ranks, kind='stable')]
+        pair_sprite, pair_column, pair_depth = pair_sprite[order], pair_column[order], pair_depth[order]
+        layer_sizes = np.bincount(ranks)
+
+        height = frame.shape[1]
+        pair_scale = pool.scale[:n][pair_sprite]
+        sprite_heights = height * pair_scale / pair_depth
+        bottoms = height / 2 + height / (2 * pair_depth)
+        tops = bottoms - sprite_heights
+        ratio = mip_heights[0] / np.maximum(sprite_heights, 1.0)
+        lods = np.minimum(np.floor(np.log2(np.maximum(ratio, 1.0))).astype(np.intp), len(mip_heights) - 1)
+        tex_w, tex_h = mip_widths[lods], mip_heights[lods]
+        u = (pair_depth * np.tan(ray_angles[pair_column]) - (lateral[pair_sprite] - half[pair_sprite])) / pair_scale
+        tex_x = np.clip((u * tex_w).astype(np.int64), 0, tex_w - 1)
+        column_base = (mip_offsets[lods] + (pool.kind[:n][pair_sprite] * tex_w + tex_x) * tex_h).astype(np.int32)
+        bands = self.lighting.get_bands(pair_depth, np.zeros(len(pair_depth), dtype=np.intp))
+        shade_offset = (bands * len(texels)).astype(np.int32)
+
+        # Um elemento por pixel de sprite visível; o que é por par entra com np.repeat, já em int32/float32
+        row_start = np.ceil(np.maximum(tops, 0)).astype(np.int32)
+        row_end = np.ceil(np.minimum(bottoms, height)).astype(np.int32)
+        counts = np.maximum(row_end - row_start, 0)
+        pair_first = np.cumsum(counts) - counts
+        step = np.arange(int(counts.sum()), dtype=np.int32) - np.repeat(pair_first.astype(np.int32), counts)
+        tex_scale = (tex_h / sprite_heights).astype(np.float32)
+        tex_y = step.astype(np.float32)
+        tex_y *= np.repeat(tex_scale, counts)
+        tex_y += np.repeat(((row_start - tops) * tex_scale).astype(np.float32), counts)
+        texel_index = tex_y.astype(np.int32)
+        np.minimum(texel_index, np.repeat(tex_h - 1, counts), out=texel_index)
+        # Índice já com o nível de sombra: a máscara de opacidade é repetida por nível para usar o mesmo índice
+        texel_index += np.repeat(column_base + shade_offset, counts)
+        # Índice no frame (coluna de raio * altura + linha); as colunas extras de COLUMN_WIDTH somam deslocamentos
+        column_width = config.COLUMN_WIDTH
+        pixel = step
+        pixel += np.repeat((pair_column * (column_width * height) + row_start).astype(np.int32), counts)
+
+        opaque = self.get_shaded_opaque(opaque)
+        layer_bounds = np.r_[0, np.cumsum(np.bincount(np.repeat(np.arange(len(layer_sizes)), layer_sizes), weights=counts))].astype(np.int64)
+        flat = frame.reshape(-1)
+        for start, end in zip(layer_bounds[:-1].tolist(), layer_bounds[1:].tolist()):
+            if end == start: continue
+            layer_index = texel_index[start:end]
+            solid = opaque[layer_index]
+            layer_pixel, values = pixel[start:end][solid], mapped[layer_index[solid]]
+            for offset in range(column_width):
+                flat[layer_pixel + offset * height] = values
+        self.last_drawn = len(visible)
@@ -0,0 +1,38 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from src import config
+
+class StripPool:
+    def __init__(self):
+        self.executor = None
+        self.executor_workers = 0
+        self.strips_per_worker = 2
+
+    def get_worker_count(self):
+        workers = config.RENDER_WORKERS
+        if workers <= 0: workers = os.cpu_count() or 1
+        return workers
+
+    def get_executor(self, workers):
+        if self.executor is None or self.executor_workers != workers:
+            self.shutdown()
+            self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='render-strip')
+            self.executor_workers = workers
+        return self.executor
+
+    def split(self, num_rays, workers):
+        # Mais faixas que workers equilibra telas onde um lado tem paredes bem mais próximas
+        strips = max(1, min(num_rays, workers * self.strips_per_worker))
+        bounds = [num_rays * i // strips for i in range(strips + 1)]
+        return list(zip(bounds[:-1], bounds[1:]))
+
+    def run(self, draw_strip, num_rays, workers, *args):
+        executor = self.get_executor(workers)
+        futures = [executor.submit(draw_strip, start, end, *args) for start, end in self.split(num_rays, workers)]
+        return [future.result() for future in futures]
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+            self.executor_workers = 0
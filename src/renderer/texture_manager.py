@@ -1,4 +1,5 @@
 import pygame
+import numpy as np
 import os
 from src import config
 
@@ -8,25 +9,110 @@ class TextureManager:
         self.scaled_cache = {} 
         self.max_cache_size = config.MAX_TEXTURE_CACHE_SIZE
         self.cache_access_count = 0
-        self.load_textures()
+        self.mipmaps = {}
+        self.mip_texels = None
+        self.mip_lookup = None
+        self.mip_offsets = None
+        self.mip_widths = None
+        self.mip_heights = None
+        self.texture_paths = {}
+        self.active_ids = None
+        self.index_textures()
+        if not config.LAZY_STARTUP:
+            self.load_textures()
+            self.build_mipmaps()
     
-    def load_textures(self):
+    def index_textures(self):
+        # Só lista os arquivos; a decodificação fica para quando um nível precisar da textura
         assets_path = "assets/textures/"
         try:
             if os.path.exists(assets_path):
                 for filename in os.listdir(assets_path):
                     if filename.lower().endswith(('.png', '.jpg', '.bmp')):
-                        path = os.path.join(assets_path, filename)
                         try:
                             tex_id = int(filename.split('.')[0])
-                            original = pygame.image.load(path)
-                            texture_size = (config.TEXTURE_SIZE, config.TEXTURE_SIZE)
-                            self.textures[tex_id] = pygame.transform.scale(original, texture_size)
-                        except (ValueError, pygame.error):
+                        except ValueError:
                             continue
+                        self.texture_paths[tex_id] = os.path.join(assets_path, filename)
         except OSError:
             pass
-    
+
+    def load_texture(self, tex_id):
+        if tex_id in self.textures: return True
+        path = self.texture_paths.get(tex_id)
+        if path is None: return False
+        try:
+            original = pygame.image.load(path)
+        except pygame.error:
+            return False
+        texture_size = (config.TEXTURE_SIZE, config.TEXTURE_SIZE)
+        self.textures[tex_id] = pygame.transform.scale(original, texture_size)
+        return True
+
+    def load_textures(self, tex_ids=None):
+        for tex_id in sorted(self.texture_paths if tex_ids is None else tex_ids):
+            self.load_texture(tex_id)
+
+    def use_level_textures(self, tex_ids):
+        # Decodifica só as texturas do nível (e a 1, usada como reserva) e monta os mipmaps apenas com elas
+        if not config.LAZY_STARTUP: return
+        tex_ids = set(tex_ids) | {1}
+        if tex_ids == self.active_ids: return
+        self.load_textures(tex_ids)
+        self.build_mipmaps(tex_ids)
+        self.active_ids = tex_ids
+
+    def build_mipmaps(self, tex_ids=None):
+        tex_ids = sorted(tex_id for tex_id in (self.textures if tex_ids is None else tex_ids) if tex_id in self.textures)
+        if not tex_ids: return
+        level = np.stack([pygame.surfarray.array3d(self.textures[tex_id]) for tex_id in tex_ids]).astype(np.float32)
+        levels = []
+        while True:
+            levels.append(level.round().astype(np.uint8))
+            _, w, h, _ = level.shape
+            if w == 1 or h == 1: break
+            # Filtro caixa 2x2 para o próximo nível
+            level = level[:, :w - w % 2, :h - h % 2]
+            level = (level[:, 0::2, 0::2] + level[:, 1::2, 0::2] + level[:, 0::2, 1::2] + level[:, 1::2, 1::2]) / 4
+
+        # Todos os níveis num único bloco (nível, textura, x, y); cada coluna de texel fica contígua
+        self.mip_texels = np.concatenate([lvl.reshape(-1, 3) for lvl in levels])
+        self.mip_widths = np.array([lvl.shape[1] for lvl in levels], dtype=np.int32)
+        self.mip_heights = np.array([lvl.shape[2] for lvl in levels], dtype=np.int32)
+        self.mip_offsets = np.zeros(len(levels), dtype=np.int64)
+        self.mip_offsets[1:] = np.cumsum([lvl.shape[0] * lvl.shape[1] * lvl.shape[2] for lvl in levels[:-1]])
+        self.mipmaps = {}
+        for index, tex_id in enumerate(tex_ids):
+            self.mipmaps[tex_id] = []
+            for lod, lvl in enumerate(levels):
+                _, w, h, _ = lvl.shape
+                start = self.mip_offsets[lod] + index * w * h
+                self.mipmaps[tex_id].append(self.mip_texels[start:start + w * h].reshape(w, h, 3))
+
+        fallback = tex_ids.index(1) if 1 in tex_ids else 0
+        self.mip_lookup = np.full(256, fallback, dtype=np.int64)
+        for index, tex_id in enumerate(tex_ids):
+            if 0 <= tex_id < 256: self.mip_lookup[tex_id] = index
+
+    def get_mip_arrays(self):
+        if not config.ENABLE_TEXTURES or self.mip_texels is None:
+            return None
+        return self.mip_texels, self.mip_lookup, self.mip_offsets, self.mip_widths, self.mip_heights
+
+    def get_texel_column(self, wall_type, lod, tex_x):
+        if not config.ENABLE_TEXTURES:
+            return None
+        levels = self.mipmaps.get(wall_type, self.mipmaps.get(1))
+        if not levels: return None
+        return levels[min(lod, len(levels) - 1)][tex_x]
+
+    def select_lod(self, wall_heights):
+        # Nível pela altura projetada: um texel por pixel de tela, no máximo
+        if self.mip_heights is None: return np.zeros_like(wall_heights, dtype=np.intp)
+        ratio = config.TEXTURE_SIZE / np.maximum(wall_heights, 1.0)
+        lod = np.floor(np.log2(np.maximum(ratio, 1.0))).astype(np.intp)
+        return np.minimum(lod, len(self.mip_heights) - 1)
+
     def get_wall_texture(self, wall_type):
         if not config.ENABLE_TEXTURES:
             return None
@@ -84,6 +170,8 @@ class TextureManager:
             'cached_textures': len(self.scaled_cache),
             'cache_access_count': self.cache_access_count,
             'texture_size': config.TEXTURE_SIZE,
+            'mip_levels': 0 if self.mip_heights is None else len(self.mip_heights),
+            'mip_bytes': 0 if self.mip_texels is None else self.mip_texels.nbytes,
             'textures_enabled': config.ENABLE_TEXTURES
         }
 
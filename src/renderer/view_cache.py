@@ -0,0 +1,60 @@
+import threading
+from collections import OrderedDict
+from src import config
+
+class ViewCache:
+    def __init__(self, max_rays=None):
+        self.frame_key = None
+        self.rays = OrderedDict()
+        self.max_rays = config.RAY_CACHE_SIZE if max_rays is None else max_rays
+        # Faixas paralelas consultam e preenchem o LRU ao mesmo tempo
+        self.lock = threading.Lock()
+        self.frame_hits = 0
+        self.frame_misses = 0
+        self.ray_hits = 0
+        self.ray_misses = 0
+
+    def reuse_frame(self, view_key):
+        # Mesma pose, versão do mapa e qualidade do último quadro: o frame anterior ainda vale
+        if view_key == self.frame_key:
+            self.frame_hits += 1
+            return True
+        self.frame_misses += 1
+        self.frame_key = view_key
+        return False
+
+    def get_rays(self, ray_key):
+        with self.lock:
+            result = self.rays.get(ray_key)
+            if result is None:
+                self.ray_misses += 1
+                return None
+            self.rays.move_to_end(ray_key)
+            self.ray_hits += 1
+            return result
+
+    def store_rays(self, ray_key, result):
+        if self.max_rays <= 0: return
+        with self.lock:
+            self.rays[ray_key] = result
+            self.rays.move_to_end(ray_key)
+            while len(self.rays) > self.max_rays:
+                self.rays.popitem(last=False)
+
+    def clear(self):
+        self.frame_key = None
+        with self.lock:
+            self.rays.clear()
+
+    def get_stats(self):
+        frames = self.frame_hits + self.frame_misses
+        rays = self.ray_hits + self.ray_misses
+        return {
+            'frame_hits': self.frame_hits,
+            'frame_misses': self.frame_misses,
+            'frame_hit_rate': self.frame_hits / frames if frames else 0.0,
+            'ray_hits': self.ray_hits,
+            'ray_misses': self.ray_misses,
+            'ray_hit_rate': self.ray_hits / rays if rays else 0.0,
+            'ray_entries': len(self.rays),
+        }
@@ -0,0 +1,84 @@
+import struct
+import numpy as np
+from src import config
+
+MAGIC = b'LREC'
+VERSION = 1
+
+# Cabeçalho: parâmetros da simulação na gravação, para o replay rodar com os mesmos
+LOG_HEADER = np.dtype([
+    ('magic', 'S4'), ('version', '<u4'),
+    ('tick_rate', '<u4'), ('max_ticks_per_frame', '<u4'),
+    ('move_speed', '<f8'), ('sensitivity', '<f8'),
+])
+# Registros depois do cabeçalho. Um byte < 0x80 é um quadro jogado: a máscara de teclas (src.player.controls)
+# seguida da duração do quadro em ms (varint). Os demais começam por uma tag.
+TAG_LEVEL = 0x80  # varint: nível iniciado (o primeiro registro é sempre um)
+TAG_CHECK = 0x81  # x, y, rot (f8) e marcações restantes (i4) do jogador ao fim da gravação
+CHECK = struct.Struct('<dddi')
+
+def encode_varint(value):
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+def decode_varint(data, pos):
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80: return value, pos
+        shift += 7
+
+class InputRecorder:
+    # Uns 2 bytes por quadro jogado: 10 minutos a 60 FPS dão ~72 KB
+    def __init__(self, path):
+        self.file = open(path, 'wb')
+        header = np.zeros(1, dtype=LOG_HEADER)
+        header['magic'], header['version'] = MAGIC, VERSION
+        header['tick_rate'], header['max_ticks_per_frame'] = config.TICK_RATE, config.MAX_TICKS_PER_FRAME
+        header['move_speed'], header['sensitivity'] = config.MOVE_SPEED, config.SENSITIVITY
+        self.file.write(header.tobytes())
+        self.frames = 0
+
+    def level(self, level):
+        self.file.write(bytes([TAG_LEVEL]) + encode_varint(level))
+
+    def frame(self, frame_ms, keys):
+        self.file.write(bytes([keys & 0x7F]) + encode_varint(max(0, int(frame_ms))))
+        self.frames += 1
+
+    def close(self, player=None):
+        if self.file.closed: return
+        if player is not None:
+            self.file.write(bytes([TAG_CHECK]) + CHECK.pack(player.x, player.y, player.rot, player.marks_left))
+        self.file.close()
+
+def read_input_log(path):
+    with open(path, 'rb') as f: data = f.read()
+    if len(data) < LOG_HEADER.itemsize: raise ValueError(f"Gravação '{path}' truncada")
+    header = np.frombuffer(data, dtype=LOG_HEADER, count=1)[0]
+    if header['magic'] != MAGIC: raise ValueError(f"'{path}' não é uma gravação de partida")
+    if header['version'] != VERSION: raise ValueError(f"Gravação versão {header['version']} não suportada (esperado {VERSION})")
+
+    records, pos = [], LOG_HEADER.itemsize
+    while pos < len(data):
+        tag = data[pos]
+        pos += 1
+        if tag < 0x80:
+            frame_ms, pos = decode_varint(data, pos)
+            records.append(('frame', frame_ms, tag))
+        elif tag == TAG_LEVEL:
+            level, pos = decode_varint(data, pos)
+            records.append(('level', level))
+        elif tag == TAG_CHECK:
+            records.append(('check',) + CHECK.unpack_from(data, pos))
+            pos += CHECK.size
+        else:
+            raise ValueError(f"Registro desconhecido 0x{tag:02x} na posição {pos - 1} de '{path}'")
+    settings = {name: header[name].item() for name in ('tick_rate', 'max_ticks_per_frame', 'move_speed', 'sensitivity')}
+    return settings, records
@@ -0,0 +1,86 @@
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import json
+import time
+import numpy as np
+from src import config
+from src.replay.input_log import read_input_log
+
+def snapshot_marks(player):
+    return {f"{x},{y}": tile for (x, y), tile in sorted(player.level_grid.marks.items())}
+
+def replay_session(game, path, render=True):
+    # Alimenta run_ticks com as teclas e as durações de quadro gravadas, sem esperar o relógio.
+    # Com render, cada quadro também desenha o mundo e o HUD como no jogo e entra no traço de tempos.
+    settings, records = read_input_log(path)
+    config.TICK_RATE, config.MAX_TICKS_PER_FRAME = settings['tick_rate'], settings['max_ticks_per_frame']
+    config.MOVE_SPEED, config.SENSITIVITY = settings['move_speed'], settings['sensitivity']
+
+    trajectory, recorded_ms, render_ms, levels, check = [], [], [], [], None
+    for record in records:
+        kind = record[0]
+        if kind == 'level':
+            if levels: levels[-1]['marks'] = snapshot_marks(game.player)
+            game.current_level = record[1]
+            game.reset_level()
+            game.change_state('playing')
+            levels.append({'level': record[1], 'first_frame': len(trajectory), 'goal_reached': False})
+        elif kind == 'frame':
+            frame_ms, keys = record[1], record[2]
+            if game.run_ticks(frame_ms / 1000, keys) == 'goal_reached': levels[-1]['goal_reached'] = True
+            player = game.player
+            trajectory.append((player.x, player.y, player.rot))
+            recorded_ms.append(frame_ms)
+            if render:
+                start = time.perf_counter()
+                game.renderer.render_game_world()
+                game.ui_manager.draw(config.DISPLAY, 'playing')
+                render_ms.append((time.perf_counter() - start) * 1000)
+        elif kind == 'check':
+            check = record[1:]
+    if levels: levels[-1]['marks'] = snapshot_marks(game.player)
+
+    result = {'log': path, 'frames': len(trajectory), 'levels': levels,
+              'trajectory': trajectory, 'recorded_ms': recorded_ms, 'render_ms': render_ms, 'check': None}
+    if check is not None:
+        player = game.player
+        # A simulação é determinística: a pose final tem de bater bit a bit com a gravada
+        result['check'] = (player.x, player.y, player.rot, player.marks_left) == tuple(check)
+    if render_ms:
+        result.update({'p50_ms': float(np.percentile(render_ms, 50)), 'p95_ms': float(np.percentile(render_ms, 95)),
+                       'p99_ms': float(np.percentile(render_ms, 99))})
+    return result
+
+def format_replay(result):
+    recorded = sum(result['recorded_ms']) / 1000
+    lines = [f"{result['log']}: {result['frames']} quadros, {recorded:.1f} s de jogo gravado"]
+    for level in result['levels']:
+        lines.append(f"  nível {level['level']}: {len(level['marks'])} marcações"
+                     f"{', saída alcançada' if level['goal_reached'] else ''}")
+    if 'p50_ms' in result:
+        lines.append(f"  render p50 {result['p50_ms']:.2f} ms  p95 {result['p95_ms']:.2f} ms  p99 {result['p99_ms']:.2f} ms")
+    if result['check'] is not None:
+        lines.append('  pose final confere com a gravação' if result['check'] else '  DIVERGÊNCIA: pose final difere da gravação')
+    return '\n'.join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Reproduz uma partida gravada com main.py --record')
+    parser.add_argument('log')
+    parser.add_argument('--no-render', action='store_true', help='só a simulação, sem desenhar os quadros')
+    parser.add_argument('--output', help='grava trajetória, marcações e tempos em JSON')
+    args = parser.parse_args(argv)
+
+    from src.game import Game
+    game = Game()
+    result = replay_session(game, args.log, render=not args.no_render)
+    print(format_replay(result))
+    if args.output:
+        with open(args.output, 'w') as f: json.dump(result, f, indent=2)
+    game.quit_game()
+    return 1 if result['check'] is False else 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,148 @@
+import math
+import numpy as np
+import pygame
+from src import config
+
+# Índices da paleta das superfícies de 8 bits do mapa
+UNEXPLORED, FLOOR, WALL, MARKED, EXIT = range(5)
+PALETTE = [(12, 12, 18), (70, 70, 80), (190, 190, 200), (230, 200, 60), (60, 210, 90)]
+MODES = ('off', 'corner', 'full')
+
+class Minimap:
+    # Mapa explorado em superfícies persistentes: a cada quadro só as células novas ou alteradas são pintadas,
+    # e o desenho é um blit mais o marcador do jogador
+    def __init__(self):
+        self.level_grid = None
+        self.explored = None
+        self.change_cursor = 0
+        self.pending = []
+        self.detail = None
+        self.detail_scale = 1
+        self.full = None
+        self.full_scale = 1.0
+        self.screen_size = None
+
+    def reset(self, level_grid):
+        self.level_grid = level_grid
+        self.explored = np.zeros(level_grid.grid.shape, dtype=bool)
+        self.change_cursor = len(level_grid.changes)
+        self.pending = []
+        height, width = level_grid.grid.shape
+        # Detalhe para o modo canto: até MINIMAP_CELL_PX por célula, limitado para mapas gerados grandes
+        self.detail_scale = max(1, min(config.MINIMAP_CELL_PX, config.MINIMAP_MAX_SURFACE // max(width, height)))
+        self.detail = self.create_surface(width * self.detail_scale, height * self.detail_scale)
+        self.full = None
+        self.screen_size = None
+
+    def create_surface(self, width, height, screen=None):
+        # Sem tela: 8 bits com paleta (um byte por pixel). Com tela: já no formato dela, para o blit ser só uma cópia
+        if screen is None:
+            surface = pygame.Surface((width, height), 0, 8)
+            surface.set_palette(PALETTE)
+        else:
+            surface = pygame.Surface((width, height), 0, screen)
+        surface.fill(PALETTE[UNEXPLORED])
+        return surface
+
+    def get_full_surface(self, screen):
+        # Modo tela cheia: escala inteira quando cabe, menos de um pixel por célula em mapas maiores que a tela
+        screen_size = screen.get_size()
+        if self.full is None or self.screen_size != screen_size:
+            height, width = self.explored.shape
+            fit = min(screen_size[0] * 0.9 / width, screen_size[1] * 0.9 / height)
+            self.full_scale = float(int(fit)) if fit >= 1 else fit
+            self.full = self.create_surface(max(1, int(width * self.full_scale)), max(1, int(height * self.full_scale)), screen)
+            self.screen_size = screen_size
+            ys, xs = np.nonzero(self.explored)
+            self.paint(self.full, self.full_scale, xs, ys)
+        return self.full
+
+    def reveal(self, view_pose, ray_angles, distance_correction, wall_buffer):
+        # Células vistas neste quadro: a parede acertada por cada raio e o chão ao longo de parte dos raios
+        px, py, prot = view_pose
+        height, width = self.explored.shape
+        angles = prot + ray_angles
+        dx, dy = np.cos(angles), np.sin(angles)
+        distances = np.minimum(wall_buffer / distance_correction, config.MAX_DEPTH)
+        hit = np.isfinite(wall_buffer)
+        # Um passo minúsculo além do ponto de acerto cai dentro da célula da parede
+        wall_x = (px + dx[hit] * (distances[hit] + 1e-4)).astype(np.int64)
+        wall_y = (py + dy[hit] * (distances[hit] + 1e-4)).astype(np.int64)
+
+        rays = slice(None, None, max(1, len(ray_angles) // config.MINIMAP_FLOOR_RAYS))
+        samples = np.arange(0.0, distances[rays].max(), 0.5)
+        along = np.minimum(samples[None, :], distances[rays, None] - 1e-4)
+        floor_x = (px + dx[rays, None] * along).astype(np.int64).ravel()
+        floor_y = (py + dy[rays, None] * along).astype(np.int64).ravel()
+
+        cells_x, cells_y = np.concatenate((wall_x, floor_x)), np.concatenate((wall_y, floor_y))
+        inside = (cells_x >= 0) & (cells_x < width) & (cells_y >= 0) & (cells_y < height)
+        cells = cells_y[inside] * width + cells_x[inside]
+        new = np.unique(cells[~self.explored.ravel()[cells]])
+        if new.size:
+            self.explored.ravel()[new] = True
+            self.pending.append(new)
+
+    def update(self, player, renderer):
+        if player.level_grid is not self.level_grid: self.reset(player.level_grid)
+        # Quadro reaproveitado: a câmera não se mexeu, nada novo à vista
+        if renderer.view_pose is not None and not renderer.frame_reused:
+            self.reveal(renderer.view_pose, renderer.ray_angles, renderer.distance_correction, renderer.wall_buffer)
+        # Marcações de parede (Player.handle_interaction_key) chegam pelo registro de mudanças da grade
+        changes = self.level_grid.changes
+        if len(changes) > self.change_cursor:
+            height, width = self.explored.shape
+            changed = np.array([y * width + x for x, y in changes[self.change_cursor:]], dtype=np.int64)
+            self.change_cursor = len(changes)
+            self.pending.append(changed[self.explored.ravel()[changed]])
+        if not self.pending: return
+        cells = np.unique(np.concatenate(self.pending))
+        self.pending = []
+        width = self.explored.shape[1]
+        xs, ys = cells % width, cells // width
+        self.paint(self.detail, self.detail_scale, xs, ys)
+        if self.full is not None: self.paint(self.full, self.full_scale, xs, ys)
+
+    def paint(self, surface, scale, xs, ys):
+        if not len(xs): return
+        tiles = self.level_grid.grid[ys, xs]
+        colors = np.full(len(tiles), WALL, dtype=np.uint8)
+        colors[tiles == 0] = FLOOR
+        colors[tiles == 9] = EXIT
+        colors[(tiles > 10) & (tiles % 11 == 0)] = MARKED
+        block = max(1, int(scale))
+        offsets = np.arange(block)
+        pixels_x = (xs * scale).astype(np.int64)[:, None, None] + offsets[None, :, None]
+        pixels_y = (ys * scale).astype(np.int64)[:, None, None] + offsets[None, None, :]
+        if surface.get_bitsize() != 8:
+            colors = np.array([surface.map_rgb(color) for color in PALETTE], dtype=np.uint32)[colors]
+        pixels = pygame.surfarray.pixels2d(surface)
+        pixels[np.minimum(pixels_x, pixels.shape[0] - 1), np.minimum(pixels_y, pixels.shape[1] - 1)] = colors[:, None, None]
+        del pixels
+
+    def draw(self, screen, player, renderer):
+        self.update(player, renderer)
+        # Marcador na mesma pose interpolada que o render usou
+        x, y, rot = renderer.view_pose or (player.x, player.y, player.rot)
+        if config.MINIMAP_MODE == 'full':
+            surface = self.get_full_surface(screen)
+            origin = ((screen.get_width() - surface.get_width()) // 2, (screen.get_height() - surface.get_height()) // 2)
+            screen.blit(surface, origin)
+            self.draw_marker(screen, origin[0] + x * self.full_scale, origin[1] + y * self.full_scale, rot, max(3, self.full_scale * 0.4))
+        elif config.MINIMAP_MODE == 'corner':
+            size = config.MINIMAP_CORNER_SIZE
+            scale = self.detail_scale
+            area = pygame.Rect(int(x * scale) - size // 2, int(y * scale) - size // 2, size, size)
+            corner = pygame.Rect(screen.get_width() - size - 20, 20, size, size)
+            screen.fill(PALETTE[UNEXPLORED], corner)
+            # Perto da borda do mapa a janela sai da superfície; o blit recorta e o destino compensa
+            screen.blit(self.detail, (corner.x + max(0, -area.x), corner.y + max(0, -area.y)), area.clip(self.detail.get_rect()))
+            self.draw_marker(screen, corner.x + size / 2, corner.y + size / 2, rot, max(3, scale * 0.6))
+
+    def draw_marker(self, screen, x, y, rot, radius):
+        pygame.draw.circle(screen, (230, 60, 60), (int(x), int(y)), int(radius))
+        tip = (int(x + math.cos(rot) * radius * 2.5), int(y + math.sin(rot) * radius * 2.5))
+        pygame.draw.line(screen, (230, 60, 60), (int(x), int(y)), tip, 2)
+
+    def cycle_mode(self):
+        config.MINIMAP_MODE = MODES[(MODES.index(config.MINIMAP_MODE) + 1) % len(MODES)]
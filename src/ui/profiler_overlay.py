@@ -0,0 +1,38 @@
+import pygame
+from src import config
+
+class ProfilerOverlay:
+    def __init__(self, profiler):
+        self.profiler = profiler
+        self.font = pygame.font.Font(None, 22)
+        self.width, self.height = 360, 120
+        self.graph_frames = 180
+        self.panel = pygame.Surface((self.width, self.height + 20 * (len(profiler.stages) + 1) + 10), pygame.SRCALPHA)
+
+    def draw(self, screen):
+        panel = self.panel
+        panel.fill((0, 0, 0, 170))
+
+        frames = self.profiler.recent(self.graph_frames)[:, 0] * 1000
+        scale_ms = 50.0
+        budget_y = self.height - self.height * (1000 / (config.FPS or 60)) / scale_ms
+        pygame.draw.line(panel, (80, 160, 80), (0, budget_y), (self.width, budget_y))
+        if len(frames) > 1:
+            step = self.width / (self.graph_frames - 1)
+            points = [(i * step, self.height - min(ms, scale_ms) / scale_ms * self.height) for i, ms in enumerate(frames)]
+            pygame.draw.lines(panel, (255, 220, 80), False, points)
+
+        averages = self.profiler.stage_averages_ms()
+        frame_ms = averages.get('frame', 0)
+        rows = [(f"frame ({1000 / max(frame_ms, 1e-3):.0f} fps)", frame_ms)]
+        for name in self.profiler.stages:
+            # check_interaction, draw_walls e upscale já estão contidos em player_update e render_world
+            indent = '    ' if name in ('check_interaction', 'draw_walls', 'upscale') else ''
+            rows.append((indent + name, averages.get(name, 0)))
+        for i, (label, value) in enumerate(rows):
+            y = self.height + 6 + i * 20
+            panel.blit(self.font.render(label, True, (230, 230, 230)), (8, y))
+            value_surface = self.font.render(f"{value:.2f} ms", True, (230, 230, 230))
+            panel.blit(value_surface, (self.width - 8 - value_surface.get_width(), y))
+
+        screen.blit(panel, (config.WIN_WIDTH - panel.get_width() - 10, 10))
@@ -0,0 +1,72 @@
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from PIL import Image, ImageSequence
+
+class TransitionAnimation:
+    def __init__(self, gif_path):
+        self.gif_path = gif_path
+        self.raw_frames = None
+        self.frames = []
+        self.frames_key = None
+        self.pending = None
+        self.scaled = None
+        self.scaled_index = None
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='transition-decode')
+
+    def decode(self):
+        # O GIF é decodificado uma única vez; os quadros RGBA crus servem para qualquer resolução
+        if self.raw_frames is None:
+            frames = []
+            try:
+                with Image.open(self.gif_path) as gif:
+                    for frame in ImageSequence.Iterator(gif):
+                        frame = frame.convert('RGBA')
+                        frames.append((frame.tobytes(), frame.size))
+            except FileNotFoundError: print(f"Erro: Arquivo GIF não encontrado em '{self.gif_path}'")
+            self.raw_frames = frames
+        return self.raw_frames
+
+    def build_frames(self, bitsize, masks):
+        # Quadros no tamanho original, compostos sobre o preto e no formato da tela (compactos, ficam a sessão toda)
+        frames = []
+        for data, frame_size in self.decode():
+            opaque = pygame.Surface(frame_size, 0, bitsize, masks)
+            opaque.fill((0, 0, 0))
+            opaque.blit(pygame.image.frombuffer(data, frame_size, 'RGBA'), (0, 0))
+            frames.append(opaque)
+        return frames
+
+    def prepare(self, screen):
+        # Chamado ao criar a janela e em cada troca de resolução; só refaz os quadros se o formato da tela mudou
+        key = (screen.get_bitsize(), screen.get_masks())
+        if key == self.frames_key: return
+        self.frames_key = key
+        self.pending = self.executor.submit(self.build_frames, *key)
+
+    def get_frames(self):
+        if self.pending is not None:
+            self.frames = self.pending.result()
+            self.pending = None
+        return self.frames
+
+    def draw(self, screen, index):
+        # Um único quadro ampliado por vez (vizinho mais próximo), refeito só quando o índice ou a tela mudam
+        frames = self.get_frames()
+        if not frames: return False
+        size = screen.get_size()
+        if self.scaled is None or self.scaled.get_size() != size or self.scaled.get_bitsize() != screen.get_bitsize():
+            self.scaled = pygame.Surface(size, 0, screen)
+            self.scaled_index = None
+        if index != self.scaled_index:
+            pygame.transform.scale(frames[index], size, self.scaled)
+            self.scaled_index = index
+        screen.blit(self.scaled, (0, 0))
+        return True
+
+    def release(self):
+        # Fim da transição: a superfície em tela cheia não fica ocupando memória durante o jogo
+        self.scaled = None
+        self.scaled_index = None
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
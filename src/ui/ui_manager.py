@@ -1,7 +1,9 @@
+import math
 import pygame
 from src import config
 from src.ui.button import Button
-from PIL import Image, ImageSequence
+from src.ui.transition_animation import TransitionAnimation
+from src.ui.minimap import Minimap
 
 class UIManager:
     def __init__(self, game_controller):
@@ -21,7 +23,8 @@ class UIManager:
         }
         self.pause_background = None
         
-        self.loading_frames = []
+        self.transition_animation = TransitionAnimation('assets/loading/door.gif')
+        self.minimap = Minimap()
         self.loading_frame_index = 0
         self.loading_animation_speed = 0.1
         self.last_frame_update = 0
@@ -79,10 +82,40 @@ class UIManager:
             "Obrigado por Jogar!",
         ]
 
+        self.instructions_text = [
+            "Objetivo:",
+            "  Você está preso em uma série de labirintos. Encontre a porta de saída",
+            "  em cada nível para escapar. Use sua perspicácia e as ferramentas",
+            "  disponíveis para não se perder.",
+            "",
+            "Marcações de Parede:",
+            "  Você pode marcar as paredes para saber por onde já passou. Isso",
+            "  ajuda a evitar andar em círculos. Você tem um número limitado de",
+            "  marcações, mas pode removê-las para usá-las em outro lugar.",
+            "",
+            "Comandos:",
+            "  - W: Mover para frente",
+            "  - S: Mover para trás",
+            "  - A / D: Girar a visão para esquerda / direita",
+            "  - E: Interagir com a porta de saída",
+            "  - F: Marcar uma parede / Remover uma marcação",
+            "  - ESC: Pausar o jogo / Voltar nos menus"
+        ]
+
         self.credits_scroll_y = config.WIN_HEIGHT
         self.credits_scroll_speed = 1.99
         self.credits_total_height = len(self.credits_text) * 60 
 
+        self.text_cache = {}
+        self.max_text_cache = 64
+        self.menu_surfaces = {}
+        self.pause_overlay = None
+        self.pause_title = None
+        self.pause_surface = None
+        self.pause_source = None
+        self.credits_strip = None
+        self.credits_strip_padding = 0
+
         self.create_all_menus()
 
     def update(self):
@@ -93,35 +126,52 @@ class UIManager:
                 self.game.change_state('main_menu')
 
     def draw_loading_screen(self, screen):
-        screen.fill((0, 0, 0))
-        if not self.loading_frames: return
+        animation = self.transition_animation
+        loading_frames = animation.get_frames()
+        if not loading_frames:
+            screen.fill((0, 0, 0))
+            return
         
         current_time = pygame.time.get_ticks()
         if current_time - self.last_frame_update > self.loading_animation_speed * 1000:
             self.last_frame_update = current_time
             if not self.gif_animation_finished:
                 self.loading_frame_index += 1
-                if self.loading_frame_index >= len(self.loading_frames):
-                    self.loading_frame_index = len(self.loading_frames) - 1
+                if self.loading_frame_index >= len(loading_frames):
+                    self.loading_frame_index = len(loading_frames) - 1
                     self.gif_animation_finished = True
 
-        current_frame = self.loading_frames[self.loading_frame_index]
-        scaled_frame = pygame.transform.scale(current_frame, (config.WIN_WIDTH, config.WIN_HEIGHT))
-        screen.blit(scaled_frame, (0, 0))
+        animation.draw(screen, self.loading_frame_index)
+        if self.gif_animation_finished: animation.release()
+
+    def render_text(self, font, text, color):
+        key = (id(font), text, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            if len(self.text_cache) >= self.max_text_cache: self.text_cache.clear()
+            surface = font.render(text, True, color)
+            self.text_cache[key] = surface
+        return surface
 
     def _draw_prompt(self, screen, text):
-        text_surface = self.prompt_font.render(text, True, (255, 255, 255))
+        key = ('prompt', text)
+        prompt = self.text_cache.get(key)
+        if prompt is None:
+            text_surface = self.prompt_font.render(text, True, (255, 255, 255))
+            bg_surface = pygame.Surface(text_surface.get_rect().inflate(20, 10).size, pygame.SRCALPHA)
+            bg_surface.fill((0, 0, 0, 150))
+            prompt = self.text_cache[key] = (bg_surface, text_surface)
+        bg_surface, text_surface = prompt
         text_rect = text_surface.get_rect(center=(config.WIN_WIDTH / 2, config.WIN_HEIGHT - 50))
-        bg_rect = text_rect.inflate(20, 10)
-        bg_surface = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
-        bg_surface.fill((0, 0, 0, 150))
-        screen.blit(bg_surface, bg_rect)
+        screen.blit(bg_surface, text_rect.inflate(20, 10))
         screen.blit(text_surface, text_rect)
 
     def draw_game_hud(self, screen):
+        self.minimap.draw(screen, self.game.player, self.game.renderer)
+        if config.EXIT_HINT: self.draw_exit_hint(screen)
         marks_used = 5 - self.game.player.marks_left
         hud_text = f"Marcações: {marks_used} / 5"
-        text_surface = self.hud_font.render(hud_text, True, (255, 255, 255))
+        text_surface = self.render_text(self.hud_font, hud_text, (255, 255, 255))
         screen.blit(text_surface, (20, config.WIN_HEIGHT - 40))
 
         target = self.game.player.interaction_target
@@ -136,6 +186,26 @@ class UIManager:
             elif target['type'] > 10 and target['type'] % 11 == 0:
                 self._draw_prompt(screen, "Pressione F para remover a marcação")
 
+    def draw_exit_hint(self, screen):
+        # Leitura O(1) no campo de distâncias do nível (Maps.get_exit_field), sem busca por quadro
+        player = self.game.player
+        field = self.game.maps.get_exit_field(self.game.current_level)
+        if field is None: return
+        x, y, rot = self.game.renderer.view_pose or (player.x, player.y, player.rot)
+        hint = field.get_hint(x, y)
+        if hint is None: return
+        angle, steps = hint
+        # Para cima na tela é a direção em que o jogador olha
+        turn = angle - rot
+        forward, side = (math.sin(turn), -math.cos(turn)), (math.cos(turn), math.sin(turn))
+        cx, cy, size = config.WIN_WIDTH / 2, 60, 26
+        points = [(cx + forward[0] * size * f + side[0] * size * s, cy + forward[1] * size * f + side[1] * size * s)
+                  for f, s in ((1, 0), (-0.7, 0.7), (-0.3, 0), (-0.7, -0.7))]
+        pygame.draw.polygon(screen, (60, 210, 90), points)
+        pygame.draw.polygon(screen, (20, 20, 20), points, 2)
+        text_surface = self.render_text(self.hud_font, f"Saída: {steps}", (255, 255, 255))
+        screen.blit(text_surface, text_surface.get_rect(midtop=(cx, cy + size + 6)))
+
     def handle_events(self, events, state):
         buttons_to_check = self.buttons.get(state, [])
         for event in events:
@@ -166,44 +236,62 @@ class UIManager:
             self.draw_game_hud(screen)
 
     def draw_how_to_play_menu(self, screen):
-        screen.fill((20, 20, 30))
-        title_surface = self.title_font.render('Como Jogar', True, (255, 255, 255))
-        title_rect = title_surface.get_rect(center=(config.WIN_WIDTH // 2, 100))
-        screen.blit(title_surface, title_rect)
+        screen.blit(self.menu_surfaces['how_to_play'], (0, 0))
+        for button in self.buttons['how_to_play']:
+            button.update()
+            button.draw(screen)
 
-        instructions = [
-            "Objetivo:",
-            "  Você está preso em uma série de labirintos. Encontre a porta de saída",
-            "  em cada nível para escapar. Use sua perspicácia e as ferramentas",
-            "  disponíveis para não se perder.",
-            "",
-            "Marcações de Parede:",
-            "  Você pode marcar as paredes para saber por onde já passou. Isso",
-            "  ajuda a evitar andar em círculos. Você tem um número limitado de",
-            "  marcações, mas pode removê-las para usá-las em outro lugar.",
-            "",
-            "Comandos:",
-            "  - W: Mover para frente",
-            "  - S: Mover para trás",
-            "  - A / D: Girar a visão para esquerda / direita",
-            "  - E: Interagir com a porta de saída",
-            "  - F: Marcar uma parede / Remover uma marcação",
-            "  - ESC: Pausar o jogo / Voltar nos menus"
-        ]
-        
+    def build_menu_surface(self, title, title_y=150):
+        surface = pygame.Surface((config.WIN_WIDTH, config.WIN_HEIGHT)).convert()
+        surface.fill((20, 20, 30))
+        title_surface = self.title_font.render(title, True, (255, 255, 255))
+        surface.blit(title_surface, title_surface.get_rect(center=(config.WIN_WIDTH // 2, title_y)))
+        return surface
+
+    def build_static_layers(self):
+        self.text_cache.clear()
+        self.menu_surfaces = {
+            'main_menu': self.build_menu_surface('Labirintity'),
+            'options_main': self.build_menu_surface('Opções'),
+            'options_resolution': self.build_menu_surface('Resolução'),
+            'options_graphics': self.build_menu_surface('Gráficos'),
+        }
+
+        how_to_play = self.build_menu_surface('Como Jogar', title_y=100)
         start_y = 200
-        for i, line in enumerate(instructions):
+        for i, line in enumerate(self.instructions_text):
             line_surface = self.instructions_font.render(line, True, (220, 220, 220))
-            screen.blit(line_surface, (config.WIN_WIDTH / 2 - 400, start_y + i * 35))
+            how_to_play.blit(line_surface, (config.WIN_WIDTH / 2 - 400, start_y + i * 35))
+        self.menu_surfaces['how_to_play'] = how_to_play
 
-        for button in self.buttons['how_to_play']:
-            button.update()
-            button.draw(screen)
+        # Escurecimento e título do pause criados uma vez; a tela pausada é montada ao pausar
+        self.pause_overlay = pygame.Surface((config.WIN_WIDTH, config.WIN_HEIGHT), pygame.SRCALPHA)
+        self.pause_overlay.fill((0, 0, 0, 150))
+        self.pause_title = self.title_font.render('Pausado', True, (255, 255, 255))
+        self.pause_surface = None
+        self.pause_source = None
 
+        self.build_credits_strip()
+        self.transition_animation.prepare(config.DISPLAY)
+
+    def build_credits_strip(self):
+        lines = []
+        for i, line in enumerate(self.credits_text):
+            font = self.credits_title_font if i == 0 else self.credits_font
+            color = (255, 255, 0) if i == 0 else (255, 255, 255)
+            lines.append(font.render(line, True, color))
+        strip_width = max(line.get_width() for line in lines)
+        self.credits_strip_padding = max(line.get_height() for line in lines)
+        strip = pygame.Surface((strip_width, self.credits_total_height + 2 * self.credits_strip_padding)).convert()
+        strip.fill((0, 0, 0))
+        for i, line_surface in enumerate(lines):
+            strip.blit(line_surface, line_surface.get_rect(center=(strip_width // 2, self.credits_strip_padding + i * 60)))
+        self.credits_strip = strip
 
     def create_all_menus(self):
         for key in self.buttons:
             self.buttons[key].clear()
+        self.build_static_layers()
 
         cx, cy = config.WIN_WIDTH // 2, config.WIN_HEIGHT // 2
 
@@ -224,17 +312,19 @@ class UIManager:
         for i, (w, h) in enumerate(resolutions):
             self.buttons['options_resolution'].append(Button(cx-150, cy-100+i*70, 300, 50, f"{w}x{h}", lambda w=w,h=h:self.game.change_resolution(w,h)))
         self.buttons['options_resolution'].append(Button(cx-150, cy-100+len(resolutions)*70, 300, 50, 'Voltar', self.game.pop_state))
-        qualities = ['low', 'medium', 'high']
+        qualities = ['low', 'medium', 'high', 'auto']
         for i, quality in enumerate(qualities):
             self.buttons['options_graphics'].append(Button(cx-150, cy-100+i*70, 300, 50, f"Qualidade: {quality.capitalize()}", lambda q=quality:self.game.set_graphics_quality(q)))
-        self.buttons['options_graphics'].append(Button(cx-150, cy-100+len(qualities)*70, 300, 50, 'Voltar', self.game.pop_state))
+        scale_text = f"Escala 3D: {round(config.RENDER_SCALE * 100)}%"
+        self.buttons['options_graphics'].append(Button(cx-150, cy-100+len(qualities)*70, 300, 50, scale_text, self.game.cycle_render_scale))
+        self.buttons['options_graphics'].append(Button(cx-150, cy-100+(len(qualities)+1)*70, 300, 50, 'Voltar', self.game.pop_state))
         self.buttons['paused'].extend([Button(cx-150, cy-50, 300, 50, 'Continuar', self.game.resume_game), Button(cx-150, cy+20, 300, 50, 'Opções', lambda: self.game.push_state('options_main')), Button(cx-150, cy+90, 300, 50, 'Sair para o Menu', lambda: self.game.change_state('main_menu'))])
 
     def draw_menu(self, screen, title, button_key):
-        screen.fill((20, 20, 30))
-        title_surface = self.title_font.render(title, True, (255, 255, 255))
-        title_rect = title_surface.get_rect(center=(config.WIN_WIDTH // 2, 150))
-        screen.blit(title_surface, title_rect)
+        menu_surface = self.menu_surfaces.get(button_key)
+        if menu_surface is None:
+            menu_surface = self.menu_surfaces[button_key] = self.build_menu_surface(title)
+        screen.blit(menu_surface, (0, 0))
 
         for button in self.buttons[button_key]:
             button.update()
@@ -253,35 +343,26 @@ class UIManager:
         self.draw_menu(screen, 'Gráficos', 'options_graphics')
 
     def draw_pause_menu(self, screen):
-        if self.pause_background: 
-            screen.blit(self.pause_background, (0, 0))
-
-        overlay = pygame.Surface((config.WIN_WIDTH, config.WIN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        screen.blit(overlay, (0, 0))
-        title_surface = self.title_font.render('Pausado', True, (255, 255, 255))
-        title_rect = title_surface.get_rect(center=(config.WIN_WIDTH // 2, 150))
-        screen.blit(title_surface, title_rect)
+        if self.pause_surface is None or self.pause_source is not self.pause_background:
+            self.pause_surface = pygame.Surface((config.WIN_WIDTH, config.WIN_HEIGHT)).convert()
+            self.pause_surface.fill((0, 0, 0))
+            if self.pause_background:
+                self.pause_surface.blit(self.pause_background, (0, 0))
+            self.pause_surface.blit(self.pause_overlay, (0, 0))
+            self.pause_surface.blit(self.pause_title, self.pause_title.get_rect(center=(config.WIN_WIDTH // 2, 150)))
+            self.pause_source = self.pause_background
+        screen.blit(self.pause_surface, (0, 0))
 
         for button in self.buttons['paused']:
             button.update(); button.draw(screen)
 
     def draw_credits(self, screen):
-        screen.fill((0, 0, 0)); y = int(self.credits_scroll_y)
-        for i, line in enumerate(self.credits_text):
-            font = self.credits_title_font if i == 0 else self.credits_font
-            color = (255, 255, 0) if i == 0 else (255, 255, 255)
-            text_surface = font.render(line, True, color)
-            text_rect = text_surface.get_rect(center=(config.WIN_WIDTH // 2, y + i * 60))
-            screen.blit(text_surface, text_rect)
-
-    def load_gif_frames(self, gif_path):
-        self.loading_frames.clear()
-        try:
-            with Image.open(gif_path) as gif:
-                for frame in ImageSequence.Iterator(gif):
-                    frame = frame.convert('RGBA')
-                    pygame_frame = pygame.image.fromstring(frame.tobytes(), frame.size, frame.mode).convert_alpha()
-                    self.loading_frames.append(pygame_frame)
-        except FileNotFoundError: print(f"Erro: Arquivo GIF não encontrado em '{gif_path}'")
-
+        screen.fill((0, 0, 0))
+        strip = self.credits_strip
+        strip_top = int(self.credits_scroll_y) - self.credits_strip_padding
+        # Só o trecho da faixa que cai na tela é copiado
+        source_top = max(0, -strip_top)
+        visible_height = min(config.WIN_HEIGHT - max(strip_top, 0), strip.get_height() - source_top)
+        if visible_height <= 0: return
+        area = pygame.Rect(0, source_top, strip.get_width(), visible_height)
+        screen.blit(strip, ((config.WIN_WIDTH - strip.get_width()) // 2, max(strip_top, 0)), area)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Raiz do projeto no sys.path: os testes importam o pacote src como o main.py, de qualquer diretório
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
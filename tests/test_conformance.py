@@ -0,0 +1,32 @@
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pytest
+from src.renderer.backends import BACKENDS
+from src.renderer.conformance import GOLDEN_PATH, GOLDEN_POSES, GOLDEN_RESOLUTION, run_conformance
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@pytest.fixture(scope='module')
+def game():
+    # Assets e pack de níveis usam caminhos relativos à raiz do projeto
+    cwd = os.getcwd()
+    os.chdir(ROOT)
+    from src.game import Game
+    game = Game()
+    game.change_resolution(*GOLDEN_RESOLUTION)
+    game.set_graphics_quality('high')
+    yield game
+    game.quit_game()
+    os.chdir(cwd)
+
+@pytest.mark.parametrize('backend', list(BACKENDS))
+def test_backend_matches_golden(game, backend):
+    # Backend ausente é pulado explicitamente, nunca conferido através do RAYCAST_FALLBACK
+    if not BACKENDS[backend]().is_available(): pytest.skip(f"backend '{backend}' não instalado")
+    golden = os.path.join(ROOT, GOLDEN_PATH)
+    results = run_conformance(game, [backend], poses_per_level=GOLDEN_POSES, golden=golden, report=lambda line: None)
+    assert len(results) == len(game.maps.get_levels()) * GOLDEN_POSES
+    failed = [f"nível {r['level']} pose {r['pose']}: {r['diff_fraction'] * 100:.3f}%" for r in results if not r['passed']]
+    assert not failed, failed